@@ -16,6 +16,22 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _resolve_auto_device() -> str:
+    """Pick the best available device"""
+    if torch.cuda.is_available():
+        return "cuda"
+    elif torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+# Resolved once at import; device availability does not change at runtime
+_AUTO_DEVICE = _resolve_auto_device()
+
+# Random source for mock predictions
+_RNG = np.random.default_rng()
+
+
 class OpenVLAPolicy:
     """OpenVLA policy wrapper for robotics control"""
 
@@ -38,14 +54,17 @@ class OpenVLAPolicy:
     def _resolve_device(self, device: str) -> str:
         """Resolve device specification to actual device"""
         if device == "auto":
-            if torch.cuda.is_available():
-                return "cuda"
-            elif torch.backends.mps.is_available():
-                return "mps"
-            else:
-                return "cpu"
+            return _AUTO_DEVICE
         return device
 
+    def _select_dtype(self) -> torch.dtype:
+        """Pick the model dtype for the device (bfloat16 on Ampere and newer)"""
+        if self.device == "cpu":
+            return torch.float32
+        if self.device.startswith("cuda") and torch.cuda.get_device_capability(self.device)[0] >= 8:
+            return torch.bfloat16
+        return torch.float16
+
     def load_model(self):
         """Load the OpenVLA model and processor"""
         try:
@@ -56,16 +75,22 @@ class OpenVLAPolicy:
             # Load model and processor
             self.model = AutoModelForVision2Seq.from_pretrained(
                 self.model_path,
-                torch_dtype=torch.float16 if self.device != "cpu" else torch.float32,
+                torch_dtype=self._select_dtype(),
+                attn_implementation="sdpa",
                 trust_remote_code=True,
             ).to(self.device)
 
+            # Fuse the forward graph; CUDA graphs need a CUDA device
+            if self.device.startswith("cuda") and hasattr(torch, "compile"):
+                self.model = torch.compile(self.model, mode="reduce-overhead", fullgraph=False)
+
             self.processor = AutoProcessor.from_pretrained(self.model_path, trust_remote_code=True)
 
             # Initialize simple action head (placeholder)
             self.action_head = self._create_action_head()
 
             logger.info("Model loaded successfully")
+            logger.info("Full OpenVLA integration pending, predictions are mocked")
 
         except ImportError as e:
             logger.warning(f"OpenVLA dependencies not available: {e}")
@@ -98,61 +123,23 @@ class OpenVLAPolicy:
         Returns:
             List of action dictionaries
         """
-        if self.model == "mock":
-            return self._mock_predict(observation)
-
-        try:
-            # For now, just return mock predictions since full OpenVLA integration
-            # would require the actual model and dependencies
-            logger.info("Using simplified mock prediction (full OpenVLA integration pending)")
-            return self._mock_predict(observation)
-
-        except Exception as e:
-            logger.error(f"Inference failed: {e}")
-            return self._mock_predict(observation)
-
-        try:
-            # Process image
-            image = self._process_image(observation)
-
-            # Create instruction (this would come from the observation or be predefined)
-            instruction = observation.get("instruction", "pick up the red block")
-
-            # For mock implementation, just return mock actions
-            if self.model == "mock":
-                return self._mock_predict(observation)
-
-            # Prepare inputs
-            inputs = self.processor(text=instruction, images=image, return_tensors="pt").to(
-                self.device
-            )
-
-            # Add state information if available
-            if "joint_positions" in observation:
-                # This would integrate joint state into the model input
-                # For now, we'll just use the image + instruction
-                pass
-
-            # Run inference
-            with torch.no_grad():
-                outputs = self.model.generate(**inputs, max_new_tokens=100, do_sample=False)
-
-            # Decode actions (simplified for mock)
-            actions = self._decode_mock_actions(outputs)
-
-            # Convert to standardized format
-            return self._format_actions(actions, observation.get("timestamp", 0.0))
-
-        except Exception as e:
-            logger.error(f"Inference failed: {e}")
-            return self._mock_predict(observation)
+        # Full OpenVLA integration (action decoding from generate()) is
+        # pending, so loaded and mock models both predict with the mock
+        return self._mock_predict(observation)
 
     def _process_image(self, observation: Dict[str, Any]) -> np.ndarray:
-        """Process image from observation"""
-        if "image" in observation and observation["image"]:
-            # Convert flat array back to image
+        """Process image from observation
+
+        observation["image"] holds raw HWC uint8 bytes (bytes, bytearray or
+        memoryview), viewed without copying; flat int lists are still accepted.
+        """
+        image_data = observation.get("image")
+        if image_data is not None and len(image_data):
             image_shape = observation.get("image_shape", [480, 640, 3])
-            image_flat = np.array(observation["image"], dtype=np.uint8)
+            if isinstance(image_data, (bytes, bytearray, memoryview)):
+                image_flat = np.frombuffer(image_data, dtype=np.uint8)
+            else:
+                image_flat = np.asarray(image_data, dtype=np.uint8)
             image = image_flat.reshape(image_shape)
 
             # Convert to RGB if needed
@@ -207,12 +194,10 @@ class OpenVLAPolicy:
 
     def _mock_predict(self, observation: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Mock prediction for development/testing"""
-        import random
-
         timestamp = observation.get("timestamp", 0.0)
 
         # Random joint positions for testing
-        joint_positions = [random.uniform(-1.57, 1.57) for _ in range(6)]
+        joint_positions = _RNG.uniform(-1.57, 1.57, size=6).tolist()
 
         return [
             {
@@ -252,7 +237,7 @@ if __name__ == "__main__":
     # Test observation
     test_observation = {
         "instruction": "pick up the red block",
-        "image": [],  # Empty for mock
+        "image": b"",  # Raw HWC uint8 bytes; empty for mock
         "image_shape": [224, 224, 3],
         "joint_positions": [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
         "timestamp": 0.0,
@@ -1,6 +1,78 @@
 # Placeholder illustrating where a real VLM would be called.
 # Swap this for an actual Transformers pipeline when ready.
 
+import cv2
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Red hue bands of the naive red mask (OpenCV hue runs 0-179)
+_RED_HUE_LUT = np.zeros(256, dtype=bool)
+_RED_HUE_LUT[:11] = True
+_RED_HUE_LUT[170:181] = True
+
+# OpenCV's fixed-point BGR2HSV division tables, so the fused kernel
+# produces exactly the hue and saturation cv2.cvtColor would
+_HSV_SHIFT = 12
+_SDIV_TABLE = np.zeros(256, dtype=np.int32)
+_HDIV_TABLE = np.zeros(256, dtype=np.int32)
+_SDIV_TABLE[1:] = np.round((255 << _HSV_SHIFT) / np.arange(1, 256))
+_HDIV_TABLE[1:] = np.round((180 << _HSV_SHIFT) / (6.0 * np.arange(1, 256)))
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _red_fraction_kernel(bgr, sdiv_table, hdiv_table):
+        """Fraction of red pixels in a BGR image, converting to HSV on the fly."""
+        height, width = bgr.shape[0], bgr.shape[1]
+        half = 1 << (_HSV_SHIFT - 1)
+        count = 0
+        for y in prange(height):
+            row_count = 0
+            for x in range(width):
+                b = np.int32(bgr[y, x, 0])
+                g = np.int32(bgr[y, x, 1])
+                r = np.int32(bgr[y, x, 2])
+                v = max(b, g, r)
+                if v < 70:
+                    continue
+                diff = v - min(b, g, r)
+                s = (diff * sdiv_table[v] + half) >> _HSV_SHIFT
+                if s < 120:
+                    continue
+                if v == r:
+                    h = g - b
+                elif v == g:
+                    h = b - r + 2 * diff
+                else:
+                    h = r - g + 4 * diff
+                h = (h * hdiv_table[diff] + half) >> _HSV_SHIFT
+                if h < 0:
+                    h += 180
+                if h <= 10 or h >= 170:
+                    row_count += 1
+            count += row_count
+        return count / (height * width)
+
+
+def red_fraction(bgr: np.ndarray) -> float:
+    """Fraction of pixels in a BGR image that fall in the naive red mask.
+
+    Red means red hue, S >= 120 and V >= 70. With Numba this is one fused
+    pass with no HSV buffer; otherwise HSV is converted and masked via a
+    hue lookup table.
+    """
+    if NUMBA_AVAILABLE:
+        return float(_red_fraction_kernel(bgr, _SDIV_TABLE, _HDIV_TABLE))
+    hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+    mask = _RED_HUE_LUT[hsv[..., 0]] & (hsv[..., 1] >= 120) & (hsv[..., 2] >= 70)
+    return float(mask.mean())
+
 
 class QwenVLStub:
     def __init__(self):
@@ -9,19 +81,8 @@ class QwenVLStub:
     def score(self, frame, goal: str) -> float:
         # TODO: implement real prompt + model call, for now a tiny heuristic:
         # if goal mentions "red" and the frame has a lot of red-ish pixels in the lower half, boost score.
-        import cv2
-        import numpy as np
-
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-        # naive red mask
-        lower1 = np.array([0, 120, 70])
-        upper1 = np.array([10, 255, 255])
-        lower2 = np.array([170, 120, 70])
-        upper2 = np.array([180, 255, 255])
-        mask = cv2.inRange(hsv, lower1, upper1) | cv2.inRange(hsv, lower2, upper2)
-        h, w = mask.shape
-        lower_half = mask[h // 2 :, :]
-        frac_red = float((lower_half > 0).sum()) / float(lower_half.size)
+        # Only the lower half is scored, so work on just that view.
+        frac_red = red_fraction(frame[frame.shape[0] // 2 :, :])
         base = 0.3 + 0.7 * min(1.0, frac_red * 4.0)
         if "red" in goal.lower():
             return base
@@ -1,10 +1,14 @@
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
 import cv2
 import numpy as np
 import uvicorn
 from adapters.noop import NoopAdapter
-from fastapi import FastAPI, File, Form, UploadFile
+from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
 
 try:
@@ -12,8 +16,6 @@ try:
 except Exception:
     DefaultAdapter = NoopAdapter
 
-app = FastAPI(title="Saorsa Rewarder", version="0.1.0")
-
 # Choose adapter via env
 ADAPTER = os.environ.get("REWARD_ADAPTER", "qwen_vl_stub").lower()
 if ADAPTER == "noop":
@@ -26,25 +28,48 @@ class ScoreResponse(BaseModel):
     score: float  # 0..1
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Decode and scoring run here so concurrent requests don't queue on the event loop
+    app.state.pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    yield
+    app.state.pool.shutdown(wait=False)
+
+
+app = FastAPI(title="Saorsa Rewarder", version="0.1.0", lifespan=lifespan)
+
+
 @app.get("/health")
 def health():
     return {"ok": True, "adapter": ADAPTER}
 
 
 @app.post("/score", response_model=ScoreResponse)
-async def score(file: UploadFile = File(...), goal: str = Form(...)):
-    data = await file.read()
+async def score(request: Request, goal: Optional[str] = None):
+    # Accept a raw image/jpeg body with ?goal=..., or multipart file + goal form fields
+    if request.headers.get("content-type", "").startswith("image/"):
+        data = await request.body()
+    else:
+        form = await request.form()
+        upload = form.get("file")
+        goal = form.get("goal", goal)
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(422, "Missing image file")
+        data = await upload.read()
+    if goal is None:
+        raise HTTPException(422, "Missing goal")
+
+    loop = asyncio.get_running_loop()
     # Decode image
     img_array = np.frombuffer(data, np.uint8)
-    frame = cv2.imdecode(img_array, cv2.IMREAD_COLOR)
+    frame = await loop.run_in_executor(app.state.pool, cv2.imdecode, img_array, cv2.IMREAD_COLOR)
     if frame is None:
         return ScoreResponse(score=0.0)
-    s = float(adapter.score(frame, goal))
+    s = float(await loop.run_in_executor(app.state.pool, adapter.score, frame, goal))
     # clamp
     s = max(0.0, min(1.0, s))
     return ScoreResponse(score=s)
 
-
 if __name__ == "__main__":
     uvicorn.run(
         app,
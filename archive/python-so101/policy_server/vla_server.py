@@ -4,28 +4,44 @@ VLA Model Server for π0-FAST and OpenVLA models.
 Runs on GPU server and serves inference requests.
 """
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response
 from typing import List, Dict, Optional
 import numpy as np
+import orjson
 import torch
+import torch.nn.functional as F
+from torchvision.io import ImageReadMode, decode_jpeg
 import asyncio
+import base64
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="VLA Model Server")
+app = FastAPI(title="VLA Model Server", default_response_class=ORJSONResponse)
 
-class InferenceRequest(BaseModel):
-    observations: List[Dict]
-    model: str = "pi0_fast"
-    action_chunk_size: int = 64
+# Model input size (width, height), as VLAConfig.image_size, when the
+# client does not send one
+DEFAULT_IMAGE_SIZE = (224, 224)
 
-class InferenceResponse(BaseModel):
-    actions: List[List[float]]
-    inference_time: float
+# ImageNet statistics used by the vision backbones
+IMAGE_MEAN = (0.485, 0.456, 0.406)
+IMAGE_STD = (0.229, 0.224, 0.225)
+
+def decode_image(payload: Dict) -> np.ndarray:
+    """Decode a raw {shape, dtype, data} image entry."""
+    raw = bytearray(base64.b64decode(payload['data']))
+    return np.frombuffer(raw, dtype=np.dtype(payload['dtype'])).reshape(payload['shape'])
+
+@lru_cache(maxsize=None)
+def normalization_stats(device: str):
+    """Mean and std as (3, 1, 1) tensors, created once per device."""
+    mean = torch.tensor(IMAGE_MEAN, device=device).view(3, 1, 1)
+    std = torch.tensor(IMAGE_STD, device=device).view(3, 1, 1)
+    return mean, std
 
 @dataclass
 class ModelWrapper:
@@ -47,8 +63,50 @@ class ModelWrapper:
         # self.model = load_openvla_model()
         self.model_type = "openvla"
         
+    def prepare_image(self, payload: Dict) -> torch.Tensor:
+        """Decode, resize and normalize one camera image on the device.
+        
+        JPEG entries are decoded to RGB by torchvision (nvJPEG on CUDA); raw
+        {shape, dtype, data} BGR entries are uploaded as-is, keeping only
+        the colour channels of BGRA/BGRD frames. Returns a normalized RGB
+        CHW float tensor; malformed entries raise a 422.
+        """
+        device = self.device if torch.cuda.is_available() else "cpu"
+        if payload.get('encoding') == 'jpeg':
+            try:
+                raw = torch.frombuffer(
+                    bytearray(base64.b64decode(payload['data'])), dtype=torch.uint8
+                )
+                tensor = decode_jpeg(raw, mode=ImageReadMode.RGB, device=device)
+            except (KeyError, TypeError, ValueError, RuntimeError) as e:
+                raise HTTPException(422, f"Invalid JPEG image: {e}")
+        else:
+            try:
+                array = decode_image(payload)
+            except (KeyError, TypeError, ValueError) as e:
+                raise HTTPException(422, f"Invalid raw image: {e}")
+            if array.ndim != 3 or array.shape[2] not in (3, 4):
+                raise HTTPException(
+                    422, f"Raw image must be HxWx3 (BGR) or HxWx4 (BGRA/BGRD), got {array.shape}"
+                )
+            image = torch.from_numpy(array[..., :3]).to(device, non_blocking=True)
+            tensor = image.permute(2, 0, 1).flip(0)
+            
+        size = tuple(payload.get('size', DEFAULT_IMAGE_SIZE))[::-1]  # (w, h) -> (h, w)
+        resized = F.interpolate(
+            tensor.unsqueeze(0).float(), size=size, mode='bilinear', antialias=True
+        )[0]
+        mean, std = normalization_stats(device)
+        return resized.div_(255.0).sub_(mean).div_(std)
+        
     async def infer(self, observations: List[Dict], chunk_size: int) -> np.ndarray:
         """Run inference on observations."""
+        for obs in observations:
+            obs['images'] = {
+                cam: self.prepare_image(entry)
+                for cam, entry in obs.get('images', {}).items()
+            }
+            
         # Placeholder for actual inference
         actions = np.random.randn(chunk_size, 7) * 0.1
         return actions
@@ -67,33 +125,54 @@ async def health():
     """Health check endpoint."""
     return {"status": "healthy", "model": model_wrapper.model_type}
 
-@app.post("/infer", response_model=InferenceResponse)
-async def infer(request: InferenceRequest):
-    """Run VLA inference."""
+@app.post("/infer", response_class=Response)
+async def infer(request: Request):
+    """Run VLA inference.
+    
+    The body ({observations, model, action_chunk_size}) is parsed with
+    orjson directly; pydantic validation would walk every image payload.
+    Actions are returned as raw little-endian float32 bytes, shaped by the
+    X-Shape header ("rows,cols"), with X-Inference-Time in seconds.
+    """
     import time
     start_time = time.time()
     
     try:
-        if request.model != model_wrapper.model_type:
-            if request.model == "pi0_fast":
+        payload = orjson.loads(await request.body())
+        observations = payload['observations']
+        model = payload.get('model', 'pi0_fast')
+        action_chunk_size = int(payload.get('action_chunk_size', 64))
+    except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        raise HTTPException(422, f"Invalid inference request: {e}")
+    
+    try:
+        if model != model_wrapper.model_type:
+            if model == "pi0_fast":
                 model_wrapper.load_pi0_fast()
-            elif request.model == "openvla":
+            elif model == "openvla":
                 model_wrapper.load_openvla()
             else:
-                raise HTTPException(400, f"Unknown model: {request.model}")
+                raise HTTPException(400, f"Unknown model: {model}")
                 
         actions = await model_wrapper.infer(
-            request.observations,
-            request.action_chunk_size
+            observations,
+            action_chunk_size
         )
         
         inference_time = time.time() - start_time
         
-        return InferenceResponse(
-            actions=actions.tolist(),
-            inference_time=inference_time
+        actions = np.ascontiguousarray(actions, dtype='<f4')
+        return Response(
+            content=actions.tobytes(),
+            media_type="application/octet-stream",
+            headers={
+                "X-Shape": f"{actions.shape[0]},{actions.shape[1]}",
+                "X-Inference-Time": str(inference_time)
+            }
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Inference error: {e}")
         raise HTTPException(500, str(e))
@@ -10,15 +10,37 @@ import cv2
 import numpy as np
 import numpy.typing as npt
 import asyncio
+import bisect
+import collections
+import copy
+import functools
+import importlib.util
+import multiprocessing
+import os
+import queue
+import sys
 import threading
 import time
+import weakref
 import yaml
 import logging
-from typing import Dict, Optional, Union, List, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Optional, Union, List, Tuple, Any, Iterator, Mapping, Callable
 from dataclasses import dataclass
 from enum import Enum
+from multiprocessing import shared_memory
 from pathlib import Path
-from collections import deque
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -27,6 +49,175 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Environment variable OpenCV reads FFmpeg writer options from
+_FFMPEG_WRITER_OPTIONS = "OPENCV_FFMPEG_WRITER_OPTIONS"
+
+# Capture and recording FourCCs, resolved once
+_MJPG_FOURCC = cv2.VideoWriter_fourcc(*'MJPG')
+_MP4V_FOURCC = cv2.VideoWriter_fourcc(*'mp4v')
+_AVC1_FOURCC = cv2.VideoWriter_fourcc(*'avc1')
+
+# Pseudo-encoder that lets OpenCV's own FFmpeg backend pick any hardware
+# path (VAAPI, MFX, D3D11) through VIDEOWRITER_PROP_HW_ACCELERATION
+_HW_ACCELERATION_ANY = "hw_acceleration_any"
+
+# Hardware H.264 encoders to try for recording, per platform, in order
+_HW_VIDEO_CODECS: Dict[str, Tuple[str, ...]] = {
+    'linux': ('h264_nvenc', 'h264_v4l2m2m', _HW_ACCELERATION_ANY),
+    'darwin': ('h264_videotoolbox',),
+    'win32': ('h264_nvenc', _HW_ACCELERATION_ANY),
+}
+
+# Frames queued per camera for the recording writer thread
+_WRITER_QUEUE_SIZE = 16
+
+# grab() calls timed per camera to estimate its capture latency
+_LATENCY_CALIBRATION_GRABS = 30
+
+# IP stream grabs faster than this were served from the backend's buffer
+# rather than waiting for the network; up to _MAX_DRAIN_GRABS of them in a
+# row are drained without decoding
+_BUFFERED_GRAB_NS = 2_000_000
+_MAX_DRAIN_GRABS = 64
+
+# Interval between periodic camera metrics log lines
+_METRICS_LOG_INTERVAL_NS = 5_000_000_000
+
+# Smoothing factor of the frame buffer depth moving average
+_DEPTH_EWMA_ALPHA = 0.05
+
+# Timestamp for empty frame buffer slots; far enough from any
+# time.monotonic_ns() value to never fall within a sync tolerance
+_EMPTY_TIMESTAMP = -(2 ** 62)
+
+if NUMBA_AVAILABLE:
+    @njit(nogil=True, cache=True, parallel=True)
+    def _pack_rgbd_kernel(
+        color: npt.NDArray[np.uint8],
+        depth: npt.NDArray[np.uint8],
+        out: npt.NDArray[np.uint8]
+    ) -> None:
+        """Interleave BGR color and depth into a 4-channel buffer without the GIL."""
+        height, width = depth.shape
+        for y in prange(height):
+            for x in range(width):
+                out[y, x, 0] = color[y, x, 0]
+                out[y, x, 1] = color[y, x, 1]
+                out[y, x, 2] = color[y, x, 2]
+                out[y, x, 3] = depth[y, x]
+
+
+def pack_rgbd(
+    color: npt.NDArray[np.uint8],
+    depth: npt.NDArray[np.uint8],
+    out: npt.NDArray[np.uint8]
+) -> npt.NDArray[np.uint8]:
+    """
+    Stack a color image and a depth map into a single RGBD frame.
+    
+    Uses a nogil Numba kernel when available so several camera threads can
+    pack frames in parallel; otherwise writes both parts into the output
+    with in-place NumPy copies, without intermediate arrays.
+    
+    Args:
+        color: (H, W, 3) uint8 color image
+        depth: (H, W) uint8 quantized depth map aligned to color
+        out: (H, W, 4) uint8 output buffer
+        
+    Returns:
+        The filled output buffer
+    """
+    if NUMBA_AVAILABLE:
+        _pack_rgbd_kernel(color, depth, out)
+        return out
+    np.copyto(out[:, :, :3], color)
+    np.copyto(out[:, :, 3], depth)
+    return out
+
+
+if NUMBA_AVAILABLE:
+    @njit(nogil=True, cache=True)
+    def _sync_indices_kernel(
+        timestamps: npt.NDArray[np.int64],
+        target: int,
+        max_diff: int,
+        best: npt.NDArray[np.int64],
+        best_ts: npt.NDArray[np.int64]
+    ) -> None:
+        """Find every camera's nearest slot in one fused pass over the matrix."""
+        for i in range(timestamps.shape[0]):
+            idx = -1
+            best_diff = max_diff
+            for j in range(timestamps.shape[1]):
+                # Each slot is read once, so a concurrent put cannot make the
+                # recorded timestamp disagree with the chosen slot
+                ts = timestamps[i, j]
+                diff = abs(ts - target)
+                if diff <= max_diff and (idx < 0 or diff < best_diff):
+                    idx = j
+                    best_diff = diff
+                    best_ts[i] = ts
+            best[i] = idx
+
+
+def sync_indices(
+    timestamps: npt.NDArray[np.int64],
+    target: int,
+    max_diff: int,
+    best: npt.NDArray[np.int64],
+    best_ts: npt.NDArray[np.int64]
+) -> npt.NDArray[np.int64]:
+    """
+    Find each camera's ring slot closest to a target timestamp.
+    
+    Uses a nogil Numba kernel when available; otherwise a vectorized NumPy
+    pass over a snapshot of the matrix.
+    
+    Args:
+        timestamps: (M, B) int64 matrix of per-camera timestamp rings
+        target: Target time.monotonic_ns() timestamp
+        max_diff: Maximum difference in nanoseconds for a slot to match
+        best: (M,) int64 output of slot indices, -1 where no slot matched
+        best_ts: (M,) int64 output of the matched slots' timestamps
+        
+    Returns:
+        The filled best array
+    """
+    if NUMBA_AVAILABLE:
+        _sync_indices_kernel(timestamps, target, max_diff, best, best_ts)
+        return best
+    snapshot = timestamps.copy()
+    diffs = np.abs(snapshot - target)
+    nearest = diffs.argmin(axis=1)
+    rows = np.arange(len(nearest))
+    best_ts[:] = snapshot[rows, nearest]
+    best[:] = np.where(diffs[rows, nearest] <= max_diff, nearest, -1)
+    return best
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; mtime and size only key the cache."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_yaml(path: Union[str, Path]) -> Any:
+    """
+    Load a YAML file with the LibYAML loader when available.
+    
+    Parses are cached until the file's mtime or size changes, so repeated
+    loads of unchanged config and calibration files skip parsing.
+    
+    Args:
+        path: Path to YAML file
+        
+    Returns:
+        Parsed document, a copy the caller may modify
+    """
+    stat = os.stat(path)
+    return copy.deepcopy(_parse_yaml_file(str(path), stat.st_mtime_ns, stat.st_size))
+
 
 class CameraError(Exception):
     """Custom exception for camera-related errors."""
@@ -55,32 +246,62 @@ class CameraConfig:
     calibration_file: Optional[str] = None
     max_reconnect_attempts: int = 3
     reconnect_delay: float = 1.0
+    max_depth_mm: float = 4000.0  # Depth mapped to 255 in RGBD frames
+    backend: str = "opencv"  # USB capture backend: opencv or v4l2 (Linux only)
+    cpu_affinity: Optional[int] = None  # CPU to pin the capture thread to (Linux only)
+    realtime_priority: Optional[int] = None  # SCHED_FIFO priority 1-99 (Linux only)
+    drop_policy: str = "keep_all"  # keep_all, or newest_only to overwrite unread frames
+    capture_process: bool = False  # Capture in a child process writing to shared memory
 
 
 class AsyncFrameBuffer:
     """Thread-safe frame buffer with timestamp synchronization."""
     
-    def __init__(self, max_size: int = 10) -> None:
+    DROP_POLICIES = ("keep_all", "newest_only")
+    
+    def __init__(self, max_size: int = 10, drop_policy: str = "keep_all") -> None:
         """
         Initialize frame buffer.
         
         Args:
             max_size: Maximum number of frames to buffer
+            drop_policy: "keep_all" keeps the last max_size frames; "newest_only"
+                overwrites the newest frame while no consumer has read it, so
+                a stalled consumer resumes on the freshest frame
         """
         if max_size <= 0:
             raise ValueError(f"max_size must be positive, got {max_size}")
+        if drop_policy not in self.DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy: {drop_policy}")
             
-        self.buffer: deque[Tuple[npt.NDArray[np.uint8], float]] = deque(maxlen=max_size)
-        self.lock = threading.RLock()
-        self.new_frame_event = threading.Event()
+        # Ring of frames with their capture timestamps (monotonic ns) stored
+        # as int64 so synchronization is a single vectorized search
+        self._frames: List[Optional[npt.NDArray[np.uint8]]] = [None] * max_size
+        self._timestamps = np.full(max_size, _EMPTY_TIMESTAMP, dtype=np.int64)
+        self._head = 0
+        self._latest: Optional[Tuple[npt.NDArray[np.uint8], int]] = None
+        self.lock = threading.Lock()
+        # Created on first wait_for_frame() so polling consumers pay nothing
+        self._new_frame_event: Optional[threading.Event] = None
+        # Frames put, and the count as of the last consumer read
+        self.drop_policy = drop_policy
+        self.generation = 0
+        self.consumed_generation = 0
+        # Metrics: frames overwritten before any consumer read them, sync
+        # lookups that found or missed a frame, and a moving average of the
+        # unread backlog sampled on every put
+        self.frames_dropped = 0
+        self.sync_hits = 0
+        self.sync_misses = 0
+        self.depth_ewma = 0.0
         
-    def put(self, frame: npt.NDArray[np.uint8], timestamp: float) -> None:
+    def put(self, frame: npt.NDArray[np.uint8], timestamp: int) -> None:
         """
         Add frame with timestamp to buffer.
         
         Args:
             frame: Image frame as numpy array
-            timestamp: Unix timestamp when frame was captured
+            timestamp: time.monotonic_ns() when frame was captured
         """
         if frame is None:
             raise ValueError("Frame cannot be None")
@@ -88,32 +309,101 @@ class AsyncFrameBuffer:
             raise ValueError(f"Invalid timestamp: {timestamp}")
             
         with self.lock:
-            self.buffer.append((frame, timestamp))
-            self.new_frame_event.set()
+            if (
+                self.drop_policy == "newest_only"
+                and self._latest is not None
+                and self.generation != self.consumed_generation
+            ):
+                # Nobody read the newest frame yet; replace it in place
+                slot = (self._head - 1) % len(self._frames)
+                self.frames_dropped += 1
+            else:
+                slot = self._head
+                self._head = (self._head + 1) % len(self._frames)
+                if self.unconsumed >= len(self._frames):
+                    self.frames_dropped += 1
+            self._frames[slot] = frame
+            self._timestamps[slot] = timestamp
+            self._latest = (frame, timestamp)
+            self.generation += 1
+            self.depth_ewma += _DEPTH_EWMA_ALPHA * (self.unconsumed - self.depth_ewma)
+            
+        event = self._new_frame_event
+        if event is not None:
+            event.set()
     
-    def get_latest(self) -> Optional[Tuple[npt.NDArray[np.uint8], float]]:
+    def get_latest(self) -> Optional[Tuple[npt.NDArray[np.uint8], int]]:
         """
         Get most recent frame without removing from buffer.
         
         Returns:
             Tuple of (frame, timestamp) or None if buffer is empty
         """
+        # Attribute reads are atomic under the GIL, so no lock is needed
+        self.consumed_generation = self.generation
+        return self._latest
+    
+    def holds(self, frame: npt.NDArray[np.uint8]) -> bool:
+        """
+        Check whether a ring slot references this exact array.
+        
+        Only put() changes which arrays the ring references, so the capture
+        thread may call this without the lock.
+        
+        Args:
+            frame: Frame array to look for
+            
+        Returns:
+            True if the array is still in the buffer
+        """
+        return any(held is frame for held in self._frames)
+    
+    @property
+    def latest_timestamp(self) -> Optional[int]:
+        """Timestamp of the newest frame, without counting as a consumer read."""
+        latest = self._latest
+        return latest[1] if latest is not None else None
+    
+    @property
+    def unconsumed(self) -> int:
+        """Number of frames put since the last consumer read."""
+        return self.generation - self.consumed_generation
+    
+    def wait_for_frame(
+        self, 
+        timeout: Optional[float] = None
+    ) -> Optional[Tuple[npt.NDArray[np.uint8], int]]:
+        """
+        Block until the next frame is added.
+        
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait forever
+            
+        Returns:
+            Tuple of (frame, timestamp) or None on timeout
+        """
         with self.lock:
-            if self.buffer:
-                return self.buffer[-1]
+            if self._new_frame_event is None:
+                self._new_frame_event = threading.Event()
+            event = self._new_frame_event
+            event.clear()
+            
+        if not event.wait(timeout):
             return None
+        self.consumed_generation = self.generation
+        return self._latest
     
     def get_synchronized(
         self, 
-        target_timestamp: float, 
+        target_timestamp: int, 
         tolerance: float = 0.05
     ) -> Optional[npt.NDArray[np.uint8]]:
         """
         Get frame closest to target timestamp within tolerance.
         
         Args:
-            target_timestamp: Target timestamp to synchronize to
-            tolerance: Maximum time difference allowed
+            target_timestamp: Target time.monotonic_ns() timestamp to synchronize to
+            tolerance: Maximum time difference allowed in seconds
             
         Returns:
             Frame closest to target timestamp or None if no match
@@ -122,29 +412,262 @@ class AsyncFrameBuffer:
             raise ValueError(f"Tolerance must be positive, got {tolerance}")
             
         with self.lock:
-            if not self.buffer:
+            timestamps = self._timestamps
+            size = len(timestamps)
+            head = self._head
+            
+            # Read from the head (oldest slot, empty slots first) the ring is
+            # in ascending timestamp order, so only the two neighbours of the
+            # insertion point can be closest
+            pos = bisect.bisect_left(
+                range(size), target_timestamp, key=lambda k: timestamps[(head + k) % size]
+            )
+            idx = -1
+            best_diff = tolerance * 1e9
+            for k in (pos - 1, pos):
+                if 0 <= k < size:
+                    slot = (head + k) % size
+                    diff = abs(int(timestamps[slot]) - target_timestamp)
+                    if diff <= best_diff and self._frames[slot] is not None:
+                        idx, best_diff = slot, diff
+                        
+            self.consumed_generation = self.generation
+            if idx < 0:
+                self.sync_misses += 1
                 return None
+            self.sync_hits += 1
+            return self._frames[idx]
+    
+    def get_at(self, index: int, timestamp: int) -> Optional[npt.NDArray[np.uint8]]:
+        """
+        Get the frame in a ring slot if it still carries the expected timestamp.
+        
+        Args:
+            index: Slot index into the timestamp ring
+            timestamp: Timestamp the slot held when it was selected
             
-            best_frame: Optional[npt.NDArray[np.uint8]] = None
-            min_diff = float('inf')
+        Returns:
+            Frame or None if the slot has since been overwritten
+        """
+        with self.lock:
+            self.consumed_generation = self.generation
+            if self._timestamps[index] != timestamp:
+                self.sync_misses += 1
+                return None
+            self.sync_hits += 1
+            return self._frames[index]
+    
+    def count_sync_miss(self) -> None:
+        """Record a synchronized lookup that found no frame in tolerance."""
+        with self.lock:
+            self.sync_misses += 1
+    
+    def get_metrics(self) -> Dict[str, Union[int, float]]:
+        """
+        Get buffer counters.
+        
+        Returns:
+            Frames put and dropped, sync hits and misses, and the average
+            unread backlog
+        """
+        with self.lock:
+            return {
+                'frames_put': self.generation,
+                'frames_dropped': self.frames_dropped,
+                'sync_hits': self.sync_hits,
+                'sync_misses': self.sync_misses,
+                'depth_ewma': self.depth_ewma,
+            }
+    
+    def bind_timestamps(self, storage: npt.NDArray[np.int64]) -> None:
+        """
+        Move timestamp storage into an externally owned int64 array.
+        
+        Lets CameraManager lay out all cameras' timestamps as rows of one
+        matrix and synchronize them in a single vectorized pass.
+        
+        Args:
+            storage: Array with one element per buffer slot
+        """
+        if storage.shape != self._timestamps.shape:
+            raise ValueError(f"Expected {self._timestamps.shape} storage, got {storage.shape}")
             
-            for frame, ts in self.buffer:
-                diff = abs(ts - target_timestamp)
-                if diff < min_diff and diff <= tolerance:
-                    min_diff = diff
-                    best_frame = frame
-                    
-            return best_frame
+        with self.lock:
+            storage[:] = self._timestamps
+            self._timestamps = storage
     
     def clear(self) -> None:
         """Clear all frames from buffer."""
         with self.lock:
-            self.buffer.clear()
-            self.new_frame_event.clear()
+            self._frames = [None] * len(self._frames)
+            self._timestamps.fill(_EMPTY_TIMESTAMP)
+            self._head = 0
+            self._latest = None
+            self.consumed_generation = self.generation
+
+
+class FrameSet(Mapping[str, npt.NDArray[np.uint8]]):
+    """
+    Reusable mapping from camera name to frame over fixed per-camera slots.
+    
+    CameraManager refills the same instance on every call instead of
+    building a new dict per tick. Take dict(frames) to keep a snapshot.
+    timestamps holds each slot's capture timestamp, so consumers polling
+    faster than the cameras can tell a new frame from a repeated one.
+    """
+    
+    def __init__(self, names: Tuple[str, ...]) -> None:
+        """
+        Initialize frame set.
+        
+        Args:
+            names: Camera names, one slot each
+        """
+        self.names = names
+        self.slots: List[Optional[npt.NDArray[np.uint8]]] = [None] * len(names)
+        self.timestamps: List[Optional[int]] = [None] * len(names)
+        self._index = {name: i for i, name in enumerate(names)}
+        
+    def __getitem__(self, name: str) -> npt.NDArray[np.uint8]:
+        frame = self.slots[self._index[name]]
+        if frame is None:
+            raise KeyError(name)
+        return frame
+    
+    def __iter__(self) -> Iterator[str]:
+        return (name for name, frame in zip(self.names, self.slots) if frame is not None)
+    
+    def __len__(self) -> int:
+        return sum(frame is not None for frame in self.slots)
+
+
+class CaptureTrigger:
+    """
+    Shared capture trigger pulsed by the control loop.
+    
+    Cameras started in triggered mode wait for a pulse, sleep their
+    calibrated offset and capture one frame stamped with the pulse time,
+    so every camera's frame for one pulse carries the same timestamp.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize trigger."""
+        self._condition = threading.Condition()
+        self.generation = 0
+        self.timestamp = 0
+        
+    def pulse(self) -> int:
+        """
+        Fire the trigger.
+        
+        Returns:
+            Monotonic ns timestamp the triggered frames will carry
+        """
+        with self._condition:
+            self.generation += 1
+            self.timestamp = time.monotonic_ns()
+            self._condition.notify_all()
+            return self.timestamp
+    
+    def wait(self, generation: int, timeout: float) -> Optional[Tuple[int, int]]:
+        """
+        Wait for a pulse newer than the given generation.
+        
+        Args:
+            generation: Last generation the caller has handled
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            (generation, timestamp) of the latest pulse, or None on timeout
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self.generation != generation, timeout):
+                return None
+            return self.generation, self.timestamp
+
+
+class CaptureBarrier:
+    """
+    Barrier releasing all triggered cameras together for every capture.
+    
+    Has CaptureTrigger's wait() interface, but rounds are paced by the
+    cameras themselves: the last camera to arrive advances the shared
+    frame index and stamps the round, so every camera tags its frame for
+    the round with the same timestamp.
+    """
+    
+    def __init__(self, parties: int, timeout: float = 0.05) -> None:
+        """
+        Initialize barrier.
+        
+        Args:
+            parties: Number of cameras capturing through the barrier
+            timeout: Seconds to wait for the other cameras before retrying
+        """
+        self._condition = threading.Condition()
+        self._timeout = timeout
+        self._waiting = 0
+        self.parties = parties
+        self.generation = 0
+        self.timestamp = 0
+        
+    def _advance(self) -> None:
+        """Start a new round (run by the last camera to arrive, lock held)."""
+        self._waiting = 0
+        self.generation += 1
+        self.timestamp = time.monotonic_ns()
+        self._condition.notify_all()
+    
+    def leave(self) -> None:
+        """
+        Withdraw a camera that stopped capturing, so the remaining cameras
+        are no longer held back waiting for it.
+        """
+        with self._condition:
+            self.parties -= 1
+            if self._waiting and self._waiting >= self.parties:
+                self._advance()
+    
+    def wait(self, generation: int, timeout: float) -> Optional[Tuple[int, int]]:
+        """
+        Wait until every camera is ready to capture.
+        
+        Args:
+            generation: Unused; rounds are never skipped
+            timeout: Unused; the barrier's own timeout applies
+            
+        Returns:
+            (generation, timestamp) of the round, or None if a camera
+            did not arrive in time
+        """
+        with self._condition:
+            round_generation = self.generation
+            self._waiting += 1
+            if self._waiting >= self.parties:
+                self._advance()
+            elif not self._condition.wait_for(
+                lambda: self.generation != round_generation, self._timeout
+            ):
+                self._waiting -= 1
+                return None
+            return self.generation, self.timestamp
 
 
 class CameraInterface:
-    """Base interface for different camera types."""
+    """
+    Base interface for different camera types.
+    
+    Each camera owns exactly one capture thread, which is the only writer
+    of its frame pool and capture handle. OpenCV's grab() and retrieve()
+    release the GIL for the blocking I/O and decode, so with retrieve()
+    writing into a pool slot, capture threads for different cameras run
+    in parallel without a separate GIL-free wrapper.
+    """
+    
+    # Channels per captured frame
+    channels = 3
+    # Whether the capture loop honours a CaptureTrigger or CaptureBarrier
+    supports_trigger = False
     
     def __init__(self, config: CameraConfig) -> None:
         """
@@ -153,22 +676,63 @@ class CameraInterface:
         Args:
             config: Camera configuration
         """
+        # The child process cannot see which pool slots the parent's ring
+        # still holds, so it could not skip the ones newest_only displaces
+        if config.capture_process and config.drop_policy == "newest_only":
+            raise ValueError("drop_policy newest_only is not supported with capture_process")
+            
         self.config = config
         self.is_running = False
         self.capture_thread: Optional[threading.Thread] = None
-        self.frame_buffer = AsyncFrameBuffer(config.buffer_size)
-        self._lock = threading.RLock()
+        self.frame_buffer = AsyncFrameBuffer(config.buffer_size, config.drop_policy)
+        self._lock = threading.Lock()
+        self._frame_requested = threading.Event()
+        
+        # Preallocated frames that capture loops write into instead of
+        # allocating per frame. One slot more than the buffer holds, and
+        # slots the buffer still holds are skipped, so the slot being
+        # written is never one the buffer hands out. A capture process gets
+        # one more, so it can write the next frame while the parent is
+        # still putting the previous one.
+        spare_slots = 2 if config.capture_process else 1
+        self._frame_pool: List[npt.NDArray[np.uint8]] = [
+            np.empty((config.height, config.width, self.channels), dtype=np.uint8)
+            for _ in range(config.buffer_size + spare_slots)
+        ]
+        self._pool_idx = 0
+        # Pool index last handed out by _next_pool_frame() and not yet
+        # published (capture process only)
+        self._pool_slot: Optional[int] = None
+        
+        # Triggered capture: None means free-running. grab_latency is the
+        # mean grab() time in seconds, measured on start unless preset.
+        self.trigger: Optional[Union[CaptureTrigger, CaptureBarrier]] = None
+        self.trigger_delay_ns = 0
+        self.grab_latency: Optional[float] = None
+        self.latency_measured = threading.Event()
+        
+        # Process capture (config.capture_process) state
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
         
     def start(self) -> None:
-        """Start camera capture in background thread."""
+        """Start camera capture in a background thread or child process."""
         with self._lock:
             if self.is_running:
                 logger.warning(f"Camera {self.config.name} already running")
                 return
                 
             self.is_running = True
+            if self.config.capture_process and self.trigger is None:
+                self._start_process()
+                target = self._receive_loop
+            else:
+                if self.config.capture_process:
+                    logger.warning(f"Triggered capture needs a thread, not a process, for {self.config.name}")
+                target = self._capture_loop_wrapper
+                
             self.capture_thread = threading.Thread(
-                target=self._capture_loop_wrapper, 
+                target=target, 
                 daemon=True,
                 name=f"Camera-{self.config.name}"
             )
@@ -183,52 +747,370 @@ class CameraInterface:
                 
             self.is_running = False
             
+        if self._process is not None:
+            self._stop_process()
+            
         if self.capture_thread:
             self.capture_thread.join(timeout=2.0)
             if self.capture_thread.is_alive():
                 logger.warning(f"Camera {self.config.name} thread did not stop cleanly")
                 
+        if self._shm is not None:
+            self._release_shm()
+                
         logger.info(f"Stopped camera {self.config.name}")
     
+    def _start_process(self) -> None:
+        """
+        Spawn the capture loop in a child process.
+        
+        The frame pool moves into a shared memory block the child captures
+        into; only (slot, timestamp) pairs cross the pipe, and a receiver
+        thread here puts the shared slots into the frame buffer. Slots
+        travel back on a second pipe once the buffer has evicted them, and
+        the child only ever writes slots it has been given back, so a
+        lagging receiver stalls the child instead of having frames
+        overwritten under it.
+        """
+        ctx = multiprocessing.get_context("spawn")
+        pool_shape = (len(self._frame_pool),) + self._frame_pool[0].shape
+        self._shm = shared_memory.SharedMemory(create=True, size=int(np.prod(pool_shape)))
+        pool = np.ndarray(pool_shape, dtype=np.uint8, buffer=self._shm.buf)
+        # Every frame handed out is a view of this array. Closing unmaps the
+        # block under any that are left, so close only once they are gone.
+        weakref.finalize(pool, self._shm.close)
+        self._frame_pool = list(pool)
+        
+        self._conn, child_conn = ctx.Pipe(duplex=False)
+        child_free_conn, self._free_conn = ctx.Pipe(duplex=False)
+        self._stop_event = ctx.Event()
+        self._frame_requested = ctx.Event()
+        self._process = ctx.Process(
+            target=_capture_process_main,
+            args=(
+                type(self), self.config, self._shm.name, child_conn, child_free_conn,
+                self._stop_event, self._frame_requested
+            ),
+            daemon=True,
+            name=f"Camera-{self.config.name}"
+        )
+        self._process.start()
+        child_conn.close()
+        child_free_conn.close()
+    
+    def _release_shm(self) -> None:
+        """
+        Move the pool back to private memory and drop the shared block.
+        
+        The block is closed once the frames still in the buffer or held by
+        consumers have been released.
+        """
+        self._frame_pool = [np.empty_like(frame) for frame in self._frame_pool]
+        self._shm = None
+    
+    def _stop_process(self) -> None:
+        """Stop the capture process and release the shared block's name."""
+        self._stop_event.set()
+        self._process.join(timeout=2.0)
+        if self._process.is_alive():
+            logger.warning(f"Camera {self.config.name} process did not stop cleanly")
+            self._process.terminate()
+            self._process.join()
+        self._process = None
+        self._shm.unlink()
+    
+    def _receive_loop(self) -> None:
+        """
+        Put frames announced by the capture process into the frame buffer,
+        handing slots the buffer evicts back to the process.
+        """
+        pool = self._frame_pool
+        # The child starts out owning every slot
+        child_owned = set(range(len(pool)))
+        try:
+            while self.is_running:
+                if not self._conn.poll(0.1):
+                    continue
+                slot, timestamp = self._conn.recv()
+                child_owned.discard(slot)
+                self.frame_buffer.put(pool[slot], timestamp)
+                for free in range(len(pool)):
+                    if free not in child_owned and not self.frame_buffer.holds(pool[free]):
+                        child_owned.add(free)
+                        self._free_conn.send(free)
+        except (EOFError, BrokenPipeError):
+            if self.is_running:
+                logger.error(f"Camera {self.config.name} capture process exited")
+                self.is_running = False
+        finally:
+            self._conn.close()
+            self._free_conn.close()
+    
+    def _apply_thread_scheduling(self) -> None:
+        """
+        Pin the calling capture thread to a CPU and raise its priority.
+        
+        Linux only: with pid 0 these calls apply to the calling thread, which
+        keeps frame arrival jitter low at high control rates. Failures (e.g.
+        missing CAP_SYS_NICE for SCHED_FIFO) are logged and capture continues.
+        """
+        cpu = self.config.cpu_affinity
+        if cpu is not None:
+            if hasattr(os, 'sched_setaffinity'):
+                try:
+                    os.sched_setaffinity(0, {cpu})
+                except OSError as e:
+                    logger.warning(f"Could not pin camera {self.config.name} to CPU {cpu}: {e}")
+            else:
+                logger.warning("Capture thread CPU pinning is only supported on Linux")
+                
+        priority = self.config.realtime_priority
+        if priority is not None:
+            if hasattr(os, 'sched_setscheduler'):
+                try:
+                    os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+                except OSError as e:
+                    logger.warning(f"Could not set realtime priority for {self.config.name}: {e}")
+            else:
+                logger.warning("Capture thread realtime priority is only supported on Linux")
+    
     def _capture_loop_wrapper(self) -> None:
         """Wrapper for capture loop with error handling."""
         try:
+            self._apply_thread_scheduling()
             self._capture_loop()
         except Exception as e:
             logger.error(f"Camera {self.config.name} capture loop failed: {e}")
             self.is_running = False
+        finally:
+            self._leave_barrier()
+    
+    def _leave_barrier(self) -> None:
+        """Stop capturing through the shared barrier, if started with one."""
+        if isinstance(self.trigger, CaptureBarrier):
+            self.trigger.leave()
+            self.trigger = None
     
     def _capture_loop(self) -> None:
         """Override in subclass for specific capture implementation."""
         raise NotImplementedError
     
+    def _next_pool_frame(self) -> npt.NDArray[np.uint8]:
+        """
+        Return the next preallocated frame slot the buffer does not hold
+        (capture thread only).
+        
+        With keep_all the ring evicts in FIFO order and the next slot in
+        turn is always free. newest_only replaces unread frames out of
+        order, so slots older ring entries still point at are skipped.
+        """
+        pool = self._frame_pool
+        if isinstance(self.frame_buffer, _SharedSlotPublisher):
+            self._pool_slot = self.frame_buffer.take_free_slot()
+            return pool[self._pool_slot]
+        for _ in range(len(pool)):
+            slot = self._pool_idx
+            frame = pool[slot]
+            self._pool_idx = (slot + 1) % len(pool)
+            if not self.frame_buffer.holds(frame):
+                break
+        self._pool_slot = slot
+        return frame
+    
+    def _take_pool_slot(self) -> int:
+        """
+        Return the pool index of the frame being published and clear it.
+        
+        Capture loops that decode without a pool destination (MJPEG
+        imdecode) never took a slot, so one is taken now.
+        """
+        if self._pool_slot is None:
+            self._next_pool_frame()
+        slot, self._pool_slot = self._pool_slot, None
+        return slot
+    
+    def request_frame(self) -> None:
+        """Ask the capture thread to decode the next grabbed frame immediately."""
+        self._frame_requested.set()
+    
+    def _retrieve_due(self, now: int, next_retrieve_time: int) -> bool:
+        """
+        Check whether a grabbed frame should be decoded.
+        
+        Frames are decoded at the configured FPS cadence, or sooner when a
+        consumer has called request_frame(). All other grabs only advance
+        the stream so the decode cost is skipped. A frame up to a quarter
+        period early still counts, so arrival jitter on a camera running at
+        exactly the configured FPS does not drop frames.
+        
+        Args:
+            now: Monotonic ns timestamp of the current grab
+            next_retrieve_time: Deadline from _next_retrieve_time(), 0 at start
+            
+        Returns:
+            True if the frame should be retrieved
+        """
+        if self._frame_requested.is_set():
+            self._frame_requested.clear()
+            return True
+        interval = 1_000_000_000 // self.config.fps
+        return now >= next_retrieve_time - interval // 4
+    
+    def _next_retrieve_time(self, now: int, next_retrieve_time: int) -> int:
+        """
+        Advance the decode deadline by one frame interval after a decode.
+        
+        Args:
+            now: Monotonic ns timestamp of the decoded grab
+            next_retrieve_time: Deadline the decoded frame was due at
+            
+        Returns:
+            Next deadline, resynced to now if the schedule fell a whole
+            interval behind (start, stalls, or a slower camera)
+        """
+        interval = 1_000_000_000 // self.config.fps
+        next_retrieve_time += interval
+        if next_retrieve_time <= now:
+            next_retrieve_time = now + interval
+        return next_retrieve_time
+    
     def get_frame(self) -> Optional[npt.NDArray[np.uint8]]:
         """
         Get latest frame.
         
+        Frames live in a reused pool and are overwritten after
+        buffer_size further captures; copy them to keep them longer.
+        
         Returns:
             Latest frame or None if no frame available
         """
         result = self.frame_buffer.get_latest()
         return result[0] if result else None
     
-    def get_frame_with_timestamp(self) -> Optional[Tuple[npt.NDArray[np.uint8], float]]:
+    def get_frame_with_timestamp(self) -> Optional[Tuple[npt.NDArray[np.uint8], int]]:
         """
         Get latest frame with timestamp.
         
         Returns:
-            Tuple of (frame, timestamp) or None if no frame available
+            Tuple of (frame, monotonic ns timestamp) or None if no frame available
         """
         return self.frame_buffer.get_latest()
 
 
+class _SharedSlotPublisher:
+    """Stands in for a child process camera's frame buffer, announcing pool slots."""
+    
+    def __init__(
+        self, 
+        pool: List[npt.NDArray[np.uint8]], 
+        take_slot: Callable[[], int], 
+        conn: Any,
+        free_conn: Any
+    ) -> None:
+        self._pool = pool
+        self._take_slot = take_slot
+        self._conn = conn
+        self._free_conn = free_conn
+        # Slots the parent has released; all of them until the first put
+        self._free = collections.deque(range(len(pool)))
+        # Set once the parent stops receiving; frames are then discarded
+        self._closed = False
+        self._size_warned = False
+        
+    def take_free_slot(self) -> int:
+        """Wait until the parent has released a slot and take it."""
+        while not self._free:
+            try:
+                if self._free_conn.poll(0.1):
+                    self._free.append(self._free_conn.recv())
+            except EOFError:
+                # The parent stopped receiving, so nothing reads the pool
+                self._closed = True
+                self._free.extend(range(len(self._pool)))
+        return self._free.popleft()
+        
+    def put(self, frame: npt.NDArray[np.uint8], timestamp: int) -> None:
+        slot = self._take_slot()
+        dst = self._pool[slot]
+        # Decoders may return a new array (imdecode, or retrieve() when the
+        # driver's size differs from the pool's); only the pool is shared
+        if frame is not dst:
+            if frame.shape == dst.shape:
+                np.copyto(dst, frame)
+            else:
+                if not self._size_warned:
+                    logger.warning(
+                        f"Captured {frame.shape} frames do not match the "
+                        f"{dst.shape} shared pool; resizing"
+                    )
+                    self._size_warned = True
+                cv2.resize(frame, (dst.shape[1], dst.shape[0]), dst=dst)
+        if self._closed:
+            return
+        try:
+            self._conn.send((slot, timestamp))
+        except BrokenPipeError:
+            self._closed = True
+
+
+def _capture_process_main(
+    camera_cls: type,
+    config: CameraConfig,
+    shm_name: str,
+    conn: Any,
+    free_conn: Any,
+    stop_event: Any,
+    frame_requested: Any
+) -> None:
+    """
+    Run a camera's capture loop in a child process.
+    
+    Args:
+        camera_cls: CameraInterface subclass to capture with
+        config: Camera configuration
+        shm_name: Shared memory block holding the frame pool
+        conn: Pipe end to announce (slot, timestamp) pairs on
+        free_conn: Pipe end the parent returns evicted slots on
+        stop_event: Set by the parent to stop capture
+        frame_requested: Shared request_frame() event
+    """
+    try:
+        shm = shared_memory.SharedMemory(name=shm_name, track=False)
+    except TypeError:  # Python < 3.13
+        shm = shared_memory.SharedMemory(name=shm_name)
+        
+    camera = camera_cls(config)
+    pool_shape = (len(camera._frame_pool),) + camera._frame_pool[0].shape
+    camera._frame_pool = list(np.ndarray(pool_shape, dtype=np.uint8, buffer=shm.buf))
+    camera.frame_buffer = _SharedSlotPublisher(
+        camera._frame_pool, camera._take_pool_slot, conn, free_conn
+    )
+    camera._frame_requested = frame_requested
+    camera.is_running = True
+    
+    def watch_stop() -> None:
+        stop_event.wait()
+        camera.is_running = False
+        
+    threading.Thread(target=watch_stop, daemon=True).start()
+    try:
+        camera._capture_loop_wrapper()
+    finally:
+        conn.close()
+        free_conn.close()
+
+
 class OpenCVCamera(CameraInterface):
     """OpenCV-based USB camera implementation."""
     
+    supports_trigger = True
+    
     def __init__(self, config: CameraConfig) -> None:
         """Initialize OpenCV camera."""
         super().__init__(config)
         self.cap: Optional[cv2.VideoCapture] = None
+        # Fail at construction rather than inside the capture thread
+        self._device_index = self._validate_device_id()
         
     def _validate_device_id(self) -> int:
         """Validate and convert device ID to integer."""
@@ -242,7 +1124,7 @@ class OpenCVCamera(CameraInterface):
         
     def _capture_loop(self) -> None:
         """Capture frames from OpenCV VideoCapture."""
-        device_id = self._validate_device_id()
+        device_id = self._device_index
         
         try:
             self.cap = cv2.VideoCapture(device_id)
@@ -250,7 +1132,9 @@ class OpenCVCamera(CameraInterface):
             if not self.cap.isOpened():
                 raise CameraError(f"Failed to open camera {device_id}")
             
-            # Set camera properties
+            # Set camera properties. MJPG keeps USB bandwidth low enough for
+            # full frame rate at high resolutions, and must be set first
+            self.cap.set(cv2.CAP_PROP_FOURCC, _MJPG_FOURCC)
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.config.width)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.config.height)
             self.cap.set(cv2.CAP_PROP_FPS, self.config.fps)
@@ -258,14 +1142,28 @@ class OpenCVCamera(CameraInterface):
             # Reduce buffer size to minimize latency
             self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             
+            if self.trigger is not None:
+                self._triggered_capture_loop(self.trigger)
+                return
+            
             consecutive_failures = 0
             max_consecutive_failures = 10
+            next_retrieve_time = 0
             
             while self.is_running:
-                ret, frame = self.cap.read()
+                # Grab every frame to keep the stream current, but only pay
+                # for decoding the ones that are actually consumed
+                ret, frame = self.cap.grab(), None
+                if ret:
+                    timestamp = time.monotonic_ns()
+                    if not self._retrieve_due(timestamp, next_retrieve_time):
+                        consecutive_failures = 0
+                        continue
+                    ret, frame = self.cap.retrieve(self._next_pool_frame())
+                    
                 if ret and frame is not None:
-                    timestamp = time.time()
                     self.frame_buffer.put(frame, timestamp)
+                    next_retrieve_time = self._next_retrieve_time(timestamp, next_retrieve_time)
                     consecutive_failures = 0
                 else:
                     consecutive_failures += 1
@@ -287,51 +1185,142 @@ class OpenCVCamera(CameraInterface):
             if self.cap is not None:
                 self.cap.release()
                 self.cap = None
+    
+    def _measure_grab_latency(self, num_grabs: int) -> float:
+        """
+        Time consecutive grab() calls.
+        
+        Args:
+            num_grabs: Number of grabs to time
+            
+        Returns:
+            Mean grab latency in seconds
+        """
+        durations = []
+        for _ in range(num_grabs):
+            start = time.monotonic_ns()
+            if self.cap.grab():
+                durations.append(time.monotonic_ns() - start)
+                
+        if not durations:
+            raise CameraError(f"Could not grab frames from {self.config.name} for latency calibration")
+        return float(np.mean(durations)) / 1e9
+    
+    def _triggered_capture_loop(self, trigger: Union[CaptureTrigger, CaptureBarrier]) -> None:
+        """
+        Capture one frame per trigger pulse or barrier round.
+        
+        Args:
+            trigger: Shared trigger pulsed by the control loop, or barrier
+                shared with the other cameras
+        """
+        if self.grab_latency is None:
+            self.grab_latency = self._measure_grab_latency(_LATENCY_CALIBRATION_GRABS)
+        self.latency_measured.set()
+        
+        generation = trigger.generation
+        consecutive_failures = 0
+        max_consecutive_failures = 10
+        
+        while self.is_running:
+            pulse = trigger.wait(generation, timeout=0.1)
+            if pulse is None:
+                continue
+            generation, trigger_time = pulse
+            
+            # Offset the grab so slower cameras are not waited on
+            delay = trigger_time + self.trigger_delay_ns - time.monotonic_ns()
+            if delay > 0:
+                time.sleep(delay / 1e9)
+                
+            ret, frame = self.cap.grab(), None
+            if ret:
+                ret, frame = self.cap.retrieve(self._next_pool_frame())
+                
+            if ret and frame is not None:
+                self.frame_buffer.put(frame, trigger_time)
+                consecutive_failures = 0
+            else:
+                consecutive_failures += 1
+                logger.warning(
+                    f"Failed to read triggered frame from {self.config.name} "
+                    f"(failure {consecutive_failures}/{max_consecutive_failures})"
+                )
+                if consecutive_failures >= max_consecutive_failures:
+                    logger.error(f"Too many consecutive failures for {self.config.name}")
+                    break
 
 
 class RealSenseCamera(CameraInterface):
     """Intel RealSense depth camera implementation."""
     
+    # BGR plus depth
+    channels = 4
+    
     def __init__(self, config: CameraConfig) -> None:
         """Initialize RealSense camera."""
         super().__init__(config)
         self.pipeline = None
         self.align = None
+        self._rs_config = None
+        # z16 depth (mm) is scaled so max_depth_mm maps to 255
+        self._depth_scale = 255.0 / config.max_depth_mm
+        self._depth_u8 = np.empty((config.height, config.width), dtype=np.uint8)
         
-    def _capture_loop(self) -> None:
-        """Capture frames from RealSense camera."""
         try:
             import pyrealsense2 as rs
-        except ImportError as e:
+        except ImportError:
+            return
+        
+        # Build the pipeline graph once; restarting capture only pays for
+        # pipeline.start()/stop()
+        self.pipeline = rs.pipeline()
+        self._rs_config = rs.config()
+        self._rs_config.enable_stream(
+            rs.stream.color, 
+            config.width, 
+            config.height, 
+            rs.format.bgr8, 
+            config.fps
+        )
+        self._rs_config.enable_stream(
+            rs.stream.depth, 
+            config.width, 
+            config.height,
+            rs.format.z16, 
+            config.fps
+        )
+        
+        # Align depth to color
+        self.align = rs.align(rs.stream.color)
+        
+    def _set_frames_queue_size(self, size: int) -> None:
+        """
+        Limit the frames librealsense queues per sensor.
+        
+        Args:
+            size: Frames each sensor may hold before the oldest is dropped
+        """
+        import pyrealsense2 as rs
+        
+        wrapper = rs.pipeline_wrapper(self.pipeline)
+        device = self._rs_config.resolve(wrapper).get_device()
+        for sensor in device.query_sensors():
+            if sensor.supports(rs.option.frames_queue_size):
+                sensor.set_option(rs.option.frames_queue_size, size)
+        
+    def _capture_loop(self) -> None:
+        """Capture frames from RealSense camera."""
+        if self.pipeline is None:
             logger.error("pyrealsense2 not installed. Install with: pip install pyrealsense2")
-            raise CameraError("RealSense library not available") from e
+            raise CameraError("RealSense library not available")
         
+        started = False
         try:
-            self.pipeline = rs.pipeline()
-            config = rs.config()
-            
-            # Configure streams
-            config.enable_stream(
-                rs.stream.color, 
-                self.config.width, 
-                self.config.height, 
-                rs.format.bgr8, 
-                self.config.fps
-            )
-            config.enable_stream(
-                rs.stream.depth, 
-                self.config.width, 
-                self.config.height,
-                rs.format.z16, 
-                self.config.fps
-            )
-            
-            # Start pipeline
-            self.pipeline.start(config)
-            
-            # Align depth to color
-            align_to = rs.stream.color
-            self.align = rs.align(align_to)
+            if self.config.buffer_size == 1:
+                self._set_frames_queue_size(1)
+            self.pipeline.start(self._rs_config)
+            started = True
             
             while self.is_running:
                 frames = self.pipeline.wait_for_frames(timeout_ms=1000)
@@ -344,15 +1333,24 @@ class RealSenseCamera(CameraInterface):
                 depth_frame = aligned_frames.get_depth_frame()
                 
                 if color_frame and depth_frame:
-                    timestamp = time.time()
+                    timestamp = time.monotonic_ns()
                     
-                    # Convert to numpy arrays
-                    color_image = np.asanyarray(color_frame.get_data())
-                    depth_image = np.asanyarray(depth_frame.get_data())
+                    # Zero-copy views over the librealsense buffers; they stay
+                    # valid while the frames are referenced, and pack_rgbd
+                    # copies them straight into the pool slot
+                    height, width = color_frame.get_height(), color_frame.get_width()
+                    color_image = np.frombuffer(
+                        color_frame.get_data(), dtype=np.uint8
+                    ).reshape(height, width, 3)
+                    depth_image = np.frombuffer(
+                        depth_frame.get_data(), dtype=np.uint16
+                    ).reshape(height, width)
+                    
+                    # Quantize depth to 8 bits with a saturating SIMD scale
+                    cv2.convertScaleAbs(depth_image, dst=self._depth_u8, alpha=self._depth_scale)
                     
                     # Stack RGB and depth (4 channels total)
-                    depth_normalized = depth_image.astype(np.uint8)
-                    rgbd_image = np.dstack((color_image, depth_normalized[:,:,np.newaxis]))
+                    rgbd_image = pack_rgbd(color_image, self._depth_u8, self._next_pool_frame())
                     
                     self.frame_buffer.put(rgbd_image, timestamp)
                     
@@ -360,9 +1358,78 @@ class RealSenseCamera(CameraInterface):
             logger.error(f"RealSense camera {self.config.name} error: {e}")
             raise
         finally:
-            if self.pipeline:
+            if started:
                 self.pipeline.stop()
-                self.pipeline = None
+
+
+class V4L2Camera(CameraInterface):
+    """
+    Linux USB camera read directly through V4L2 memory-mapped streaming.
+    
+    Bypasses OpenCV's capture wrapper: frames are dequeued from the
+    driver's mmap buffers by linuxpy and MJPEG is only decoded for frames
+    that are actually consumed.
+    """
+    
+    def __init__(self, config: CameraConfig) -> None:
+        """Initialize V4L2 camera."""
+        super().__init__(config)
+        try:
+            self._device_index = int(config.device_id)
+        except (ValueError, TypeError) as e:
+            raise CameraError(f"Invalid device ID: {config.device_id}") from e
+        if self._device_index < 0:
+            raise CameraError(f"Device ID must be non-negative, got {self._device_index}")
+        
+    def _capture_loop(self) -> None:
+        """Capture frames from the V4L2 device."""
+        try:
+            from linuxpy.video.device import Device, PixelFormat, VideoCapture
+        except ImportError as e:
+            logger.error("linuxpy not installed. Install with: pip install linuxpy")
+            raise CameraError("V4L2 library not available") from e
+        
+        try:
+            with Device.from_id(self._device_index) as device:
+                # A single driver buffer (VIDIOC_REQBUFS count=1) when
+                # single-buffered, so a dequeued frame is never stale
+                if self.config.buffer_size == 1:
+                    capture = VideoCapture(device, size=1)
+                else:
+                    capture = VideoCapture(device)
+                capture.set_format(self.config.width, self.config.height, "MJPG")
+                capture.set_fps(self.config.fps)
+                
+                next_retrieve_time = 0
+                with capture:
+                    for v4l2_frame in capture:
+                        if not self.is_running:
+                            break
+                            
+                        timestamp = time.monotonic_ns()
+                        if not self._retrieve_due(timestamp, next_retrieve_time):
+                            continue
+                            
+                        data = np.frombuffer(v4l2_frame.data, dtype=np.uint8)
+                        if v4l2_frame.pixel_format == PixelFormat.MJPEG:
+                            frame = cv2.imdecode(data, cv2.IMREAD_COLOR)
+                        else:
+                            frame = cv2.cvtColor(
+                                data.reshape(v4l2_frame.height, v4l2_frame.width, 2),
+                                cv2.COLOR_YUV2BGR_YUYV,
+                                dst=self._next_pool_frame()
+                            )
+                            
+                        if frame is None:
+                            logger.warning(f"Failed to decode frame from {self.config.name}")
+                            continue
+                            
+                        self.frame_buffer.put(frame, timestamp)
+                        next_retrieve_time = self._next_retrieve_time(timestamp, next_retrieve_time)
+                        
+        except Exception as e:
+            logger.error(f"V4L2 camera {self.config.name} error: {e}")
+            raise
 
 
 class IPCamera(CameraInterface):
@@ -374,6 +1441,8 @@ class IPCamera(CameraInterface):
         if not isinstance(config.device_id, str):
             raise ValueError(f"IP camera requires string URL, got {type(config.device_id)}")
         self.stream_url = str(config.device_id)
+        # Fail at construction rather than inside the capture thread
+        self._validate_url(self.stream_url)
         self.cap: Optional[cv2.VideoCapture] = None
         
     def _validate_url(self, url: str) -> None:
@@ -385,8 +1454,6 @@ class IPCamera(CameraInterface):
         
     def _capture_loop(self) -> None:
         """Capture frames from IP camera stream."""
-        self._validate_url(self.stream_url)
-        
         reconnect_attempts = 0
         
         while self.is_running and reconnect_attempts < self.config.max_reconnect_attempts:
@@ -401,12 +1468,32 @@ class IPCamera(CameraInterface):
                 
                 consecutive_failures = 0
                 max_consecutive_failures = 10
+                next_retrieve_time = 0
+                drained = 0
                 
                 while self.is_running:
-                    ret, frame = self.cap.read()
+                    # Skip decoding grabbed frames nobody will consume
+                    grab_start = time.monotonic_ns()
+                    ret, frame = self.cap.grab(), None
+                    if ret:
+                        timestamp = time.monotonic_ns()
+                        # Drain frames the backend buffered while we fell
+                        # behind so the frame decoded is the live one
+                        if timestamp - grab_start < _BUFFERED_GRAB_NS:
+                            if drained < _MAX_DRAIN_GRABS:
+                                drained += 1
+                                consecutive_failures = 0
+                                continue
+                        else:
+                            drained = 0
+                        if not self._retrieve_due(timestamp, next_retrieve_time):
+                            consecutive_failures = 0
+                            continue
+                        ret, frame = self.cap.retrieve(self._next_pool_frame())
+                        
                     if ret and frame is not None:
-                        timestamp = time.time()
                         self.frame_buffer.put(frame, timestamp)
+                        next_retrieve_time = self._next_retrieve_time(timestamp, next_retrieve_time)
                         consecutive_failures = 0
                         reconnect_attempts = 0  # Reset on success
                     else:
@@ -444,19 +1531,60 @@ class IPCamera(CameraInterface):
 class CameraManager:
     """Manages multiple cameras for robot arm system."""
     
-    def __init__(self, config_file: Optional[str] = None) -> None:
+    # Recording encoder chosen by the first start_recording() probe, shared
+    # by all managers since it depends only on the host; None means mp4v
+    _video_codec: Optional[str] = None
+    _video_codec_probed = False
+    
+    def __init__(
+        self, 
+        config_file: Optional[str] = None,
+        pin_capture_threads: bool = False,
+        realtime_priority: Optional[int] = None
+    ) -> None:
         """
         Initialize camera manager.
         
         Args:
             config_file: Optional path to YAML configuration file
+            pin_capture_threads: Pin capture threads to CPUs round-robin (Linux only)
+            realtime_priority: SCHED_FIFO priority for capture threads (Linux only)
         """
         self.cameras: Dict[str, CameraInterface] = {}
+        # Resolved once so path validation does no filesystem I/O
+        self._allowed_base = Path.cwd().resolve()
+        self.pin_capture_threads = pin_capture_threads
+        self.realtime_priority = realtime_priority
         self.recording_enabled = False
         self.recording_path: Optional[Path] = None
         self.video_writers: Dict[str, cv2.VideoWriter] = {}
+        # Encoding runs on one writer thread per camera fed by a bounded queue
+        self._writer_queues: Dict[str, queue.Queue] = {}
+        self._writer_threads: Dict[str, threading.Thread] = {}
+        self.dropped_frames: Dict[str, int] = {}
         self._lock = threading.RLock()
         self._recording_lock = threading.Lock()
+        # Per-camera timestamp rings as rows of one (M, B) matrix
+        self._ts_matrix = np.empty((0, 0), dtype=np.int64)
+        # sync_indices() outputs, reused on every synchronized read
+        self._sync_best = np.empty(0, dtype=np.int64)
+        self._sync_best_ts = np.empty(0, dtype=np.int64)
+        # Fixed once cameras are added so per-tick reads avoid dict iteration
+        self._camera_names: Tuple[str, ...] = ()
+        self._camera_list: Tuple[CameraInterface, ...] = ()
+        # Bound frame buffer readers, resolved once instead of per camera per tick
+        self._latest_readers: Tuple[Callable[[], Optional[Tuple[npt.NDArray[np.uint8], int]]], ...] = ()
+        self._slot_readers: Tuple[Callable[[int, int], Optional[npt.NDArray[np.uint8]]], ...] = ()
+        self._frames_out = FrameSet(())
+        self._synced_frames_out = FrameSet(())
+        self._next_metrics_log = 0
+        # Per-camera preprocessing for get_synchronized_frames_preprocessed(),
+        # created on first use once the cameras are known
+        self._prep_pool: Optional[ThreadPoolExecutor] = None
+        self._prep_out: Optional[npt.NDArray[np.float32]] = None
+        self._prep_scratch: List[Tuple[npt.NDArray[np.uint8], npt.NDArray[np.uint8]]] = []
+        # Set by start_all(triggered=True) or start_all(barrier=True)
+        self._trigger: Optional[Union[CaptureTrigger, CaptureBarrier]] = None
         
         if config_file:
             self.load_config(config_file)
@@ -465,6 +1593,13 @@ class CameraManager:
         """
         Validate and sanitize file path.
         
+        Relative paths are anchored at the working directory captured at
+        construction without touching the filesystem. With '..' rejected
+        they cannot leave that directory, so no prefix check is needed.
+        Absolute paths are resolved and trusted, as they always were:
+        callers name recording and calibration locations on other mounts
+        explicitly, and an allowlist would reject those.
+        
         Args:
             path: Path to validate
             
@@ -474,17 +1609,15 @@ class CameraManager:
         Raises:
             ValueError: If path is invalid or contains traversal attempts
         """
-        path_obj = Path(path).resolve()
+        path_obj = Path(path)
         
         # Check for path traversal attempts
-        try:
-            path_obj.relative_to(Path.cwd())
-        except ValueError:
-            # Path is outside current directory, check if it's absolute and safe
-            if not path_obj.is_absolute():
-                raise ValueError(f"Invalid path: {path}")
-                
-        return path_obj
+        if '..' in path_obj.parts:
+            raise ValueError(f"Invalid path: {path}")
+            
+        if path_obj.is_absolute():
+            return path_obj.resolve()
+        return self._allowed_base / path_obj
     
     def load_config(self, config_file: str) -> None:
         """
@@ -499,8 +1632,7 @@ class CameraManager:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
             
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_yaml(config_path)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML configuration: {e}") from e
         
@@ -520,7 +1652,11 @@ class CameraManager:
                     width=cam_config.get('width', 1280),
                     height=cam_config.get('height', 720),
                     fps=cam_config.get('fps', 30),
-                    mount_position=cam_config.get('mount', 'wrist')
+                    mount_position=cam_config.get('mount', 'wrist'),
+                    backend=cam_config.get('backend', 'opencv'),
+                    drop_policy=cam_config.get('drop_policy', 'keep_all'),
+                    capture_process=cam_config.get('capture_process', False),
+                    buffer_size=cam_config.get('buffer_size', 5)
                 )
             except Exception as e:
                 logger.error(f"Failed to add camera {cam_name}: {e}")
@@ -533,7 +1669,11 @@ class CameraManager:
         width: int = 1280, 
         height: int = 720, 
         fps: int = 30,
-        mount_position: str = "wrist"
+        mount_position: str = "wrist",
+        backend: str = "opencv",
+        drop_policy: str = "keep_all",
+        capture_process: bool = False,
+        buffer_size: int = 5
     ) -> None:
         """
         Add a camera to the manager.
@@ -546,6 +1686,11 @@ class CameraManager:
             height: Frame height in pixels
             fps: Frames per second
             mount_position: Camera mounting position
+            backend: USB capture backend (opencv, or v4l2 on Linux)
+            drop_policy: Frame buffer drop policy (keep_all or newest_only)
+            capture_process: Capture in a child process instead of a thread
+            buffer_size: Frames kept per camera; 1 also shrinks the driver
+                queue so only the newest frame is ever held
         """
         if not name:
             raise ValueError("Camera name cannot be empty")
@@ -557,6 +1702,8 @@ class CameraManager:
             raise ValueError(f"Invalid resolution: {width}x{height}")
         if fps <= 0:
             raise ValueError(f"Invalid FPS: {fps}")
+        if buffer_size <= 0:
+            raise ValueError(f"Invalid buffer size: {buffer_size}")
         
         # Create camera configuration
         try:
@@ -571,12 +1718,21 @@ class CameraManager:
             width=width,
             height=height,
             fps=fps,
-            mount_position=mount_position
+            buffer_size=buffer_size,
+            mount_position=mount_position,
+            backend=backend.lower(),
+            drop_policy=drop_policy,
+            capture_process=capture_process
         )
         
         # Create appropriate camera instance
         if config.type in (CameraType.OPENCV, CameraType.USB):
-            camera = OpenCVCamera(config)
+            if config.backend == "v4l2" and self._v4l2_supported():
+                camera = V4L2Camera(config)
+            else:
+                if config.backend == "v4l2":
+                    logger.warning(f"V4L2 backend unavailable for {name}, using OpenCV")
+                camera = OpenCVCamera(config)
         elif config.type == CameraType.REALSENSE:
             camera = RealSenseCamera(config)
         elif config.type == CameraType.IP:
@@ -586,17 +1742,174 @@ class CameraManager:
         
         with self._lock:
             self.cameras[name] = camera
+            self._camera_names = tuple(self.cameras)
+            self._camera_list = tuple(self.cameras.values())
+            self._latest_readers = tuple(cam.frame_buffer.get_latest for cam in self._camera_list)
+            self._slot_readers = tuple(cam.frame_buffer.get_at for cam in self._camera_list)
+            self._frames_out = FrameSet(self._camera_names)
+            self._synced_frames_out = FrameSet(self._camera_names)
+            self._rebuild_timestamp_matrix()
             
         logger.info(f"Added camera {name} ({camera_type}) at {mount_position}")
     
-    def start_all(self) -> None:
-        """Start all cameras."""
+    @staticmethod
+    def _v4l2_supported() -> bool:
+        """Check whether direct V4L2 capture can be used on this host."""
+        return sys.platform.startswith('linux') and importlib.util.find_spec('linuxpy') is not None
+    
+    def _rebuild_timestamp_matrix(self) -> None:
+        """Rebind every camera's timestamp ring to a row of a shared matrix."""
+        cameras = self._camera_list
+        width = max(cam.config.buffer_size for cam in cameras)
+        matrix = np.full((len(cameras), width), _EMPTY_TIMESTAMP, dtype=np.int64)
+        
+        for row, camera in zip(matrix, cameras):
+            camera.frame_buffer.bind_timestamps(row[:camera.config.buffer_size])
+            
+        self._ts_matrix = matrix
+        self._sync_best = np.empty(len(cameras), dtype=np.int64)
+        self._sync_best_ts = np.empty(len(cameras), dtype=np.int64)
+    
+    def start_all(
+        self, 
+        triggered: bool = False, 
+        latency_file: Optional[str] = None,
+        barrier: bool = False
+    ) -> None:
+        """
+        Start all cameras.
+        
+        Args:
+            triggered: Capture on trigger_capture() pulses instead of free-running.
+                Frames only line up across cameras when pulses come no faster
+                than the slowest camera's fps; a camera still grabbing skips
+                to the newest pulse
+            latency_file: Calibration YAML holding per-camera capture latency;
+                measured latencies are stored there when it has none
+            barrier: Capture in lockstep, every camera waiting for the others
+                before each frame, with one shared timestamp per round
+        """
+        if triggered and barrier:
+            raise ValueError("Choose either triggered or barrier capture")
+        synchronized = triggered or barrier
+            
+        cpus: List[int] = []
+        if self.pin_capture_threads and hasattr(os, 'sched_getaffinity'):
+            cpus = sorted(os.sched_getaffinity(0))
+            
         with self._lock:
-            for camera in self.cameras.values():
+            if triggered:
+                self._trigger = CaptureTrigger()
+            elif barrier:
+                parties = sum(cam.supports_trigger for cam in self._camera_list)
+                self._trigger = CaptureBarrier(parties) if parties else None
+            else:
+                self._trigger = None
+            stored_latency = self._load_capture_latency(latency_file) if synchronized else {}
+            
+            for i, camera in enumerate(self.cameras.values()):
+                if cpus and camera.config.cpu_affinity is None:
+                    camera.config.cpu_affinity = cpus[i % len(cpus)]
+                if self.realtime_priority is not None and camera.config.realtime_priority is None:
+                    camera.config.realtime_priority = self.realtime_priority
+                    
+                camera.trigger = None
+                if synchronized:
+                    if camera.supports_trigger:
+                        camera.trigger = self._trigger
+                        camera.grab_latency = stored_latency.get(camera.config.name)
+                    else:
+                        logger.warning(f"Camera {camera.config.name} does not support triggers, free-running")
                 try:
                     camera.start()
                 except Exception as e:
                     logger.error(f"Failed to start camera {camera.config.name}: {e}")
+                    camera._leave_barrier()
+                    
+            if self._trigger is not None:
+                self._schedule_trigger_delays(latency_file, stored_latency)
+    
+    def _load_capture_latency(self, latency_file: Optional[str]) -> Dict[str, float]:
+        """Read stored per-camera capture latency, if any."""
+        if latency_file is None:
+            return {}
+        path = self._validate_path(latency_file)
+        if not path.exists():
+            return {}
+        data = CameraCalibration.load_calibration(str(path)) or {}
+        return {name: float(value) for name, value in data.get('capture_latency', {}).items()}
+    
+    def _schedule_trigger_delays(
+        self, 
+        latency_file: Optional[str],
+        stored_latency: Dict[str, float]
+    ) -> None:
+        """
+        Offset each triggered camera so all captures land together.
+        
+        Camera i sleeps (p_max - p_i) after a pulse, where p_i is its mean
+        grab latency and p_max the slowest camera's.
+        
+        Args:
+            latency_file: Calibration YAML to store measured latencies in
+            stored_latency: Latencies already loaded from latency_file
+        """
+        cameras = [cam for cam in self._camera_list if cam.trigger is not None]
+        for camera in cameras:
+            if not camera.latency_measured.wait(timeout=5.0):
+                logger.warning(f"Capture latency calibration timed out for {camera.config.name}")
+                
+        latencies = {
+            cam.config.name: cam.grab_latency for cam in cameras if cam.grab_latency is not None
+        }
+        if not latencies:
+            return
+            
+        slowest = max(latencies.values())
+        for camera in cameras:
+            latency = latencies.get(camera.config.name, slowest)
+            camera.trigger_delay_ns = int((slowest - latency) * 1e9)
+            logger.info(
+                f"Camera {camera.config.name} capture latency {latency * 1000:.1f}ms, "
+                f"trigger offset {camera.trigger_delay_ns / 1e6:.1f}ms"
+            )
+            
+        if latency_file is not None and latencies != stored_latency:
+            path = self._validate_path(latency_file)
+            data: Dict[str, Any] = {}
+            if path.exists():
+                data = CameraCalibration.load_calibration(str(path)) or {}
+            data['capture_latency'] = latencies
+            CameraCalibration.save_calibration(data, str(path))
+    
+    def trigger_capture(self) -> int:
+        """
+        Pulse the shared capture trigger (start_all(triggered=True) only).
+        
+        Returns:
+            Timestamp to pass to get_synchronized_frames() for this pulse
+        """
+        if not isinstance(self._trigger, CaptureTrigger):
+            raise CameraError("Cameras were not started in triggered mode")
+        return self._trigger.pulse()
+    
+    def last_synchronized_timestamp(self) -> Optional[int]:
+        """
+        Timestamp of the newest trigger pulse or barrier round that every
+        synchronized camera has captured.
+        
+        Returns:
+            Timestamp to pass to get_synchronized_frames(), or None when
+            capture is free-running or a camera has no frame yet
+        """
+        if self._trigger is None:
+            return None
+        latest = [
+            cam.frame_buffer.latest_timestamp for cam in self._camera_list if cam.trigger is not None
+        ]
+        if not latest or None in latest:
+            return None
+        return min(latest)
     
     def stop_all(self) -> None:
         """Stop all cameras."""
@@ -610,52 +1923,289 @@ class CameraManager:
                     camera.stop()
                 except Exception as e:
                     logger.error(f"Error stopping camera {camera.config.name}: {e}")
+                    
+        self._log_metrics("Camera totals")
     
-    def get_frames(self) -> Dict[str, npt.NDArray[np.uint8]]:
+    def get_metrics(self) -> Dict[str, Dict[str, Union[int, float]]]:
         """
-        Get latest frames from all cameras.
+        Get per-camera buffer and recording metrics.
         
         Returns:
-            Dictionary mapping camera names to frames
+            Dictionary mapping camera names to their counters
+        """
+        metrics = {}
+        for name, camera in zip(self._camera_names, self._camera_list):
+            metrics[name] = camera.frame_buffer.get_metrics()
+            metrics[name]['recording_dropped'] = self.dropped_frames.get(name, 0)
+        return metrics
+    
+    def _log_metrics(self, title: str) -> None:
+        """Log one line of metrics per camera."""
+        for name, stats in self.get_metrics().items():
+            logger.info(
+                f"{title} {name}: put={stats['frames_put']} dropped={stats['frames_dropped']} "
+                f"sync_hits={stats['sync_hits']} sync_misses={stats['sync_misses']} "
+                f"depth={stats['depth_ewma']:.2f} recording_dropped={stats['recording_dropped']}"
+            )
+    
+    def _maybe_log_metrics(self) -> None:
+        """Log a metrics snapshot at most every _METRICS_LOG_INTERVAL_NS."""
+        now = time.monotonic_ns()
+        if now >= self._next_metrics_log:
+            if self._next_metrics_log:
+                self._log_metrics("Camera metrics")
+            self._next_metrics_log = now + _METRICS_LOG_INTERVAL_NS
+    
+    def get_frames(self) -> FrameSet:
         """
-        frames: Dict[str, npt.NDArray[np.uint8]] = {}
+        Get latest frames from all cameras.
         
+        Returns:
+            Mapping of camera names to frames, refilled in place on each call
+        """
         with self._lock:
-            for name, camera in self.cameras.items():
-                frame = camera.get_frame()
-                if frame is not None:
-                    frames[name] = frame
+            frames = self._frames_out
+            slots = frames.slots
+            timestamps = frames.timestamps
+            for i, get_latest in enumerate(self._latest_readers):
+                latest = get_latest()
+                slots[i], timestamps[i] = latest if latest is not None else (None, None)
                     
+        self._maybe_log_metrics()
+        return frames
+    
+    def get_latest_frames(self) -> FrameSet:
+        """
+        Get the newest captured frame from every camera without matching
+        timestamps, and have each camera decode its next grab right away.
+        
+        With single-buffered cameras (buffer_size=1) this is the lowest
+        latency read: no frame older than the last capture is ever held.
+        
+        Returns:
+            Mapping of camera names to frames, refilled in place on each call
+        """
+        frames = self.get_frames()
+        if self._trigger is None:
+            with self._lock:
+                for camera in self._camera_list:
+                    camera.request_frame()
         return frames
     
     def get_synchronized_frames(
         self, 
-        timestamp: float, 
+        timestamp: int, 
         tolerance: float = 0.05
-    ) -> Dict[str, npt.NDArray[np.uint8]]:
+    ) -> FrameSet:
         """
         Get frames from all cameras synchronized to a specific timestamp.
         
+        In triggered and barrier mode frames carry their pulse's or round's
+        timestamp, so only frames captured for exactly this timestamp match
+        and tolerance is not used (see last_synchronized_timestamp()).
+        
         Args:
-            timestamp: Target timestamp for synchronization
-            tolerance: Maximum time difference allowed
+            timestamp: Target time.monotonic_ns() timestamp for synchronization,
+                or a trigger_capture() timestamp in triggered mode
+            tolerance: Maximum time difference allowed in seconds
             
         Returns:
-            Dictionary mapping camera names to synchronized frames
+            Mapping of camera names to synchronized frames, refilled in place
+            on each call
         """
         if tolerance <= 0:
             raise ValueError(f"Tolerance must be positive, got {tolerance}")
             
-        frames: Dict[str, npt.NDArray[np.uint8]] = {}
-        
         with self._lock:
-            for name, camera in self.cameras.items():
-                frame = camera.frame_buffer.get_synchronized(timestamp, tolerance)
-                if frame is not None:
-                    frames[name] = frame
+            frames = self._synced_frames_out
+            slots = frames.slots
+            timestamps = frames.timestamps
+            cameras = self._camera_list
+            for i in range(len(slots)):
+                slots[i] = None
+                timestamps[i] = None
+            if not cameras:
+                return frames
+                
+            # Pick the nearest slot for every camera in one pass over the matrix
+            max_diff = 0 if self._trigger is not None else int(tolerance * 1e9)
+            best = sync_indices(
+                self._ts_matrix, timestamp, max_diff, self._sync_best, self._sync_best_ts
+            )
+            
+            get_at = self._slot_readers
+            for i, (idx, ts) in enumerate(zip(best.tolist(), self._sync_best_ts.tolist())):
+                if idx >= 0:
+                    slots[i] = get_at[i](idx, ts)
+                    timestamps[i] = ts if slots[i] is not None else None
+                else:
+                    cameras[i].frame_buffer.count_sync_miss()
+                    
+            # Have the next grab decoded so the following tick sees a fresh frame
+            if self._trigger is None:
+                for camera in cameras:
+                    camera.request_frame()
                     
+        self._maybe_log_metrics()
         return frames
     
+    def get_synchronized_frames_preprocessed(
+        self, 
+        timestamp: int, 
+        target_size: Tuple[int, int],
+        tolerance: float = 0.05
+    ) -> Tuple[npt.NDArray[np.float32], npt.NDArray[np.bool_]]:
+        """
+        Get synchronized frames resized and normalized into one batch.
+        
+        Cameras are preprocessed in parallel on a thread pool; OpenCV and
+        NumPy release the GIL, so this scales with cores. Each camera's
+        result is written straight into its slice of a preallocated batch,
+        which is refilled in place on each call.
+        
+        Args:
+            timestamp: Target time.monotonic_ns() timestamp for synchronization
+            target_size: Output size as (width, height)
+            tolerance: Maximum time difference allowed in seconds
+            
+        Returns:
+            Tuple of the (N, 3, H, W) float32 RGB batch in [0, 1], in camera
+            order, and a length-N mask of cameras that had a frame
+        """
+        frames = self.get_synchronized_frames(timestamp, tolerance)
+        count = len(frames.slots)
+        width, height = target_size
+        
+        if self._prep_out is None or self._prep_out.shape != (count, 3, height, width):
+            if self._prep_pool is not None:
+                self._prep_pool.shutdown()
+            self._prep_pool = ThreadPoolExecutor(
+                max_workers=max(1, count), thread_name_prefix="CameraPrep"
+            )
+            self._prep_out = np.empty((count, 3, height, width), dtype=np.float32)
+            self._prep_scratch = [
+                (
+                    np.empty((height, width, cam.channels), dtype=np.uint8),
+                    np.empty((height, width, 3), dtype=np.uint8)
+                )
+                for cam in self._camera_list
+            ]
+            
+        out = self._prep_out
+        valid = np.array([frame is not None for frame in frames.slots], dtype=bool)
+        futures = [
+            self._prep_pool.submit(self._preprocess_frame, frame, self._prep_scratch[i], out[i])
+            for i, frame in enumerate(frames.slots) if frame is not None
+        ]
+        out[~valid] = 0.0
+        wait(futures)
+        for future in futures:
+            future.result()
+            
+        return out, valid
+    
+    @staticmethod
+    def _preprocess_frame(
+        frame: npt.NDArray[np.uint8],
+        scratch: Tuple[npt.NDArray[np.uint8], npt.NDArray[np.uint8]],
+        out: npt.NDArray[np.float32]
+    ) -> None:
+        """Resize a BGR(A) frame and write it into out as CHW RGB in [0, 1]."""
+        resized, rgb = scratch
+        cv2.resize(frame, (resized.shape[1], resized.shape[0]), dst=resized, interpolation=cv2.INTER_LINEAR)
+        code = cv2.COLOR_BGRA2RGB if resized.shape[2] == 4 else cv2.COLOR_BGR2RGB
+        cv2.cvtColor(resized, code, dst=rgb)
+        np.multiply(rgb.transpose(2, 0, 1), np.float32(1.0 / 255.0), out=out)
+    
+    def _open_video_writer(
+        self, 
+        output_file: str, 
+        fps: float, 
+        frame_size: Tuple[int, int],
+        codec: Optional[str]
+    ) -> cv2.VideoWriter:
+        """
+        Open a video writer.
+        
+        Args:
+            output_file: Path of the video file to write
+            fps: Frames per second
+            frame_size: Frame size as (width, height)
+            codec: FFmpeg hardware encoder name, _HW_ACCELERATION_ANY, or None
+                for software MPEG-4
+            
+        Returns:
+            Video writer (check isOpened())
+        """
+        if codec is None:
+            return cv2.VideoWriter(output_file, _MP4V_FOURCC, fps, frame_size)
+        if codec == _HW_ACCELERATION_ANY:
+            return cv2.VideoWriter(
+                output_file,
+                cv2.CAP_FFMPEG,
+                _AVC1_FOURCC,
+                fps,
+                frame_size,
+                [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+            )
+            
+        previous = os.environ.get(_FFMPEG_WRITER_OPTIONS)
+        os.environ[_FFMPEG_WRITER_OPTIONS] = f"video_codec;{codec}"
+        try:
+            return cv2.VideoWriter(
+                output_file,
+                cv2.CAP_FFMPEG,
+                _AVC1_FOURCC,
+                fps,
+                frame_size
+            )
+        finally:
+            if previous is None:
+                del os.environ[_FFMPEG_WRITER_OPTIONS]
+            else:
+                os.environ[_FFMPEG_WRITER_OPTIONS] = previous
+    
+    def _probe_video_codec(
+        self, 
+        probe_dir: Path, 
+        fps: float, 
+        frame_size: Tuple[int, int]
+    ) -> Optional[str]:
+        """
+        Find a working hardware H.264 encoder, probing only once.
+        
+        Args:
+            probe_dir: Writable directory for throwaway probe files
+            fps: Frames per second to probe with
+            frame_size: Frame size as (width, height)
+            
+        Returns:
+            Encoder name, or None to use software MPEG-4
+        """
+        cls = type(self)
+        if cls._video_codec_probed:
+            return cls._video_codec
+            
+        platform = 'linux' if sys.platform.startswith('linux') else sys.platform
+        for codec in _HW_VIDEO_CODECS.get(platform, ()):
+            probe_file = probe_dir / f".probe_{codec}.mp4"
+            writer = self._open_video_writer(str(probe_file), fps, frame_size, codec)
+            try:
+                opened = writer.isOpened()
+                if opened:
+                    writer.write(np.zeros((frame_size[1], frame_size[0], 3), dtype=np.uint8))
+            finally:
+                writer.release()
+                probe_file.unlink(missing_ok=True)
+                
+            if opened:
+                cls._video_codec = codec
+                break
+                
+        cls._video_codec_probed = True
+        logger.info(f"Recording with {cls._video_codec or 'software mp4v'} encoder")
+        return cls._video_codec
+    
     def start_recording(self, output_dir: str, episode_id: str) -> None:
         """
         Start recording video from all cameras.
@@ -676,15 +2226,14 @@ class CameraManager:
             with self._lock:
                 for name, camera in self.cameras.items():
                     config = camera.config
-                    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+                    frame_size = (config.width, config.height)
+                    codec = self._probe_video_codec(self.recording_path, config.fps, frame_size)
                     output_file = str(self.recording_path / f"{name}.mp4")
                     
-                    writer = cv2.VideoWriter(
-                        output_file,
-                        fourcc,
-                        config.fps,
-                        (config.width, config.height)
-                    )
+                    writer = self._open_video_writer(output_file, config.fps, frame_size, codec)
+                    if not writer.isOpened() and codec is not None:
+                        logger.warning(f"{codec} writer failed for {name}, using software mp4v")
+                        writer = self._open_video_writer(output_file, config.fps, frame_size, None)
                     
                     if not writer.isOpened():
                         # Clean up any writers that were created
@@ -694,10 +2243,39 @@ class CameraManager:
                         raise CameraError(f"Failed to create video writer for {name}")
                         
                     self.video_writers[name] = writer
+                    
+                for name, writer in self.video_writers.items():
+                    frame_queue: queue.Queue = queue.Queue(maxsize=_WRITER_QUEUE_SIZE)
+                    thread = threading.Thread(
+                        target=self._writer_loop,
+                        args=(name, writer, frame_queue),
+                        daemon=True,
+                        name=f"Writer-{name}"
+                    )
+                    self._writer_queues[name] = frame_queue
+                    self._writer_threads[name] = thread
+                    self.dropped_frames[name] = 0
+                    thread.start()
             
             self.recording_enabled = True
             logger.info(f"Started recording to {self.recording_path}")
     
+    def _writer_loop(
+        self, 
+        name: str, 
+        writer: cv2.VideoWriter, 
+        frame_queue: queue.Queue
+    ) -> None:
+        """Encode queued frames until the None sentinel arrives."""
+        while True:
+            frame = frame_queue.get()
+            if frame is None:
+                break
+            try:
+                writer.write(frame)
+            except Exception as e:
+                logger.error(f"Error writing frame for {name}: {e}")
+    
     def stop_recording(self) -> None:
         """Stop recording video."""
         with self._recording_lock:
@@ -706,6 +2284,20 @@ class CameraManager:
                 
             self.recording_enabled = False
             
+            with self._lock:
+                writer_queues = dict(self._writer_queues)
+                writer_threads = dict(self._writer_threads)
+                self._writer_queues.clear()
+                self._writer_threads.clear()
+                
+            # Let writers drain what is queued before releasing them
+            for frame_queue in writer_queues.values():
+                frame_queue.put(None)
+            for name, thread in writer_threads.items():
+                thread.join(timeout=5.0)
+                if thread.is_alive():
+                    logger.warning(f"Writer for {name} did not stop cleanly")
+                    
             with self._lock:
                 for writer in self.video_writers.values():
                     try:
@@ -715,6 +2307,9 @@ class CameraManager:
                         
                 self.video_writers.clear()
                 
+            dropped = sum(self.dropped_frames.values())
+            if dropped:
+                logger.warning(f"Dropped {dropped} frames while recording: {self.dropped_frames}")
             logger.info("Stopped recording")
     
     def save_frame_batch(
@@ -725,6 +2320,10 @@ class CameraManager:
         """
         Save a batch of frames with timestamp (for dataset creation).
         
+        Frames are queued for the per-camera writer threads and never block
+        the caller; when a writer falls behind, frames are dropped and
+        counted in dropped_frames.
+        
         Args:
             frames: Dictionary mapping camera names to frames
             timestamp: Timestamp for the frame batch
@@ -732,13 +2331,20 @@ class CameraManager:
         if not self.recording_enabled:
             return
             
-        with self._lock:
-            for name, frame in frames.items():
-                if name in self.video_writers:
-                    try:
-                        self.video_writers[name].write(frame)
-                    except Exception as e:
-                        logger.error(f"Error writing frame for {name}: {e}")
+        for name, frame in frames.items():
+            frame_queue = self._writer_queues.get(name)
+            if frame_queue is None:
+                continue
+            # The copy detaches the frame from the camera's pool slot; for
+            # RGBD frames it also packs the BGR planes the writer expects
+            if frame.ndim == 3 and frame.shape[2] == 4:
+                frame = np.ascontiguousarray(frame[..., :3])
+            else:
+                frame = frame.copy()
+            try:
+                frame_queue.put_nowait(frame)
+            except queue.Full:
+                self.dropped_frames[name] += 1
     
     def __enter__(self) -> 'CameraManager':
         """Context manager entry."""
@@ -747,6 +2353,9 @@ class CameraManager:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit - ensure cleanup."""
         self.stop_all()
+        if self._prep_pool is not None:
+            self._prep_pool.shutdown()
+            self._prep_pool = None
 
 
 class CameraCalibration:
@@ -786,19 +2395,28 @@ class CameraCalibration:
         frames_captured = 0
         gray_shape = None
         
+        # Run the per-pixel work through OpenCV's transparent API when an
+        # OpenCL device is present; UMat inputs dispatch to OpenCL kernels
+        use_opencl = cv2.ocl.haveOpenCL()
+        if use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+            logger.info("Using OpenCL for calibration image processing")
+        
         while frames_captured < num_frames:
             frame = camera.get_frame()
             if frame is None:
                 time.sleep(0.1)
                 continue
             
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            gray_shape = gray.shape
+            gray = cv2.cvtColor(cv2.UMat(frame) if use_opencl else frame, cv2.COLOR_BGR2GRAY)
+            gray_shape = frame.shape[:2]
             ret, corners = cv2.findChessboardCorners(gray, checkerboard_size, None)
             
             if ret:
                 objpoints.append(objp)
                 corners2 = cv2.cornerSubPix(gray, corners, (11, 11), (-1, -1), criteria)
+                if isinstance(corners2, cv2.UMat):
+                    corners2 = corners2.get()
                 imgpoints.append(corners2)
                 frames_captured += 1
                 
@@ -873,8 +2491,7 @@ class CameraCalibration:
         if not calib_path.exists():
             raise FileNotFoundError(f"Calibration file not found: {calib_path}")
             
-        with open(calib_path, 'r') as f:
-            return yaml.safe_load(f)
+        return load_yaml(calib_path)
 
 
 # Example usage for async integration with robot control
@@ -887,36 +2504,54 @@ async def camera_robot_sync_example() -> None:
     try:
         cam_manager.add_camera("wrist", "opencv", 0)
         cam_manager.add_camera("table", "opencv", 1)
-        cam_manager.start_all()
+        # Offset each camera's capture by its measured latency so both fire
+        # together on every pulse; pass latency_file to keep the measurement
+        cam_manager.start_all(triggered=True)
         
         # Simulated robot control loop at 200Hz
         control_rate = 200  # Hz
-        dt = 1.0 / control_rate
+        # A camera still grabbing when the next pulse fires skips ahead to
+        # the newest one, so pulse no faster than the slowest camera runs
+        slowest_fps = min(cam.config.fps for cam in cam_manager.cameras.values())
+        trigger_every = -(-control_rate // slowest_fps)
+        last_read: Optional[int] = None
+        # Deadlines are computed from the start time and tick count on a
+        # monotonic clock, so they neither drift nor accumulate rounding
+        # when the period is not a whole number of nanoseconds
+        start_ns = time.perf_counter_ns()
+        tick = 0
         
-        for _ in range(1000):  # Run for ~5 seconds
-            loop_start = time.time()
-            
-            # Get current timestamp for synchronization
-            current_time = time.time()
+        for step in range(1000):  # Run for ~5 seconds
+            if step % trigger_every == 0:
+                cam_manager.trigger_capture()
             
-            # Get synchronized frames (will use closest frames within tolerance)
-            frames = cam_manager.get_synchronized_frames(current_time, tolerance=0.02)
+            # Get the newest frame set every camera has captured, once
+            synced = cam_manager.last_synchronized_timestamp()
+            frames = {}
+            if synced is not None and synced != last_read:
+                frames = cam_manager.get_synchronized_frames(synced)
+                last_read = synced
             
             # Process frames for VLA model (async)
             if frames:
                 # Prepare observation for policy
                 # observation = {
                 #     'images': frames,
-                #     'timestamp': current_time
+                #     'timestamp': last_read
                 # }
                 # Here you would send to policy server asynchronously
                 # action = await policy_client.get_action(observation)
                 pass
             
-            # Sleep to maintain control rate
-            elapsed = time.time() - loop_start
-            if elapsed < dt:
-                await asyncio.sleep(dt - elapsed)
+            # Sleep until the next tick; a late tick catches up without sleeping,
+            # but after falling a full period behind skip the missed ticks
+            tick += 1
+            now = time.perf_counter_ns()
+            behind = (now - start_ns) * control_rate // 1_000_000_000 - tick
+            if behind >= 1:
+                tick += behind + 1
+            next_deadline = start_ns + tick * 1_000_000_000 // control_rate
+            await asyncio.sleep(max(0, next_deadline - now) / 1e9)
                 
     except Exception as e:
         logger.error(f"Error in camera-robot sync: {e}")
@@ -938,13 +2573,17 @@ def main() -> None:
             
             logger.info("Camera manager started. Press 'q' to quit.")
             
+            period_ns = 1_000_000_000 // 30  # ~30 FPS
+            next_deadline = time.perf_counter_ns()
+            
             for i in range(300):  # Run for ~10 seconds at 30 FPS
                 frames = manager.get_frames()
                 if "test_cam" in frames:
                     cv2.imshow("Test Camera", frames["test_cam"])
-                    if cv2.waitKey(33) & 0xFF == ord('q'):
+                    if cv2.waitKey(1) & 0xFF == ord('q'):
                         break
-                time.sleep(0.033)  # ~30 FPS
+                next_deadline += period_ns
+                time.sleep(max(0, next_deadline - time.perf_counter_ns()) / 1e9)
                 
         except Exception as e:
             logger.error(f"Error in main: {e}")
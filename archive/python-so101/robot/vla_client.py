@@ -5,10 +5,13 @@ Connects camera feeds to remote VLA models (π0-FAST/OpenVLA).
 """
 
 import asyncio
+import base64
+import collections
+import importlib.util
 import numpy as np
-import aiohttp
+import httpx
 import cv2
-import json
+import orjson
 import time
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
@@ -16,6 +19,11 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# httpx negotiates HTTP/2 only when the h2 package is installed (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
 @dataclass
 class VLAConfig:
     """Configuration for VLA model inference."""
@@ -24,6 +32,7 @@ class VLAConfig:
     action_chunk_size: int = 64
     observation_history: int = 3
     image_size: Tuple[int, int] = (224, 224)
+    jpeg_quality: int = 85
     timeout: float = 0.1  # 100ms max latency
 
 class VLAClient:
@@ -31,22 +40,40 @@ class VLAClient:
     
     def __init__(self, config: VLAConfig):
         self.config = config
-        self.session = None
-        self.observation_buffer = []
-        self.action_buffer = []
+        self.client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+        self.observation_buffer = collections.deque(maxlen=config.observation_history)
+        # Latest action chunk, consumed by index rather than re-slicing
+        self.action_buffer = np.empty((0, 0))
+        self._action_idx = 0
         self.last_inference_time = 0
         
     async def initialize(self):
         """Initialize connection to model server."""
-        self.session = aiohttp.ClientSession()
+        async with self._client_lock:
+            if self.client is None or self.client.is_closed:
+                # One long-lived client with a keep-alive connection pool, so
+                # inference calls skip TCP/TLS setup and DNS lookups. Over
+                # HTTPS, HTTP/2 multiplexes concurrent requests on one connection.
+                self.client = httpx.AsyncClient(
+                    http2=_HTTP2_AVAILABLE,
+                    limits=httpx.Limits(
+                        max_connections=32,
+                        max_keepalive_connections=32,
+                        keepalive_expiry=30
+                    ),
+                    timeout=self.config.timeout
+                )
         
         # Test connection
         try:
-            async with self.session.get(f"{self.config.server_url}/health") as resp:
-                if resp.status == 200:
-                    logger.info(f"Connected to VLA server at {self.config.server_url}")
-                else:
-                    logger.error(f"VLA server unhealthy: {resp.status}")
+            resp = await self.client.get(f"{self.config.server_url}/health", timeout=5.0)
+            if resp.status_code == 200:
+                logger.info(
+                    f"Connected to VLA server at {self.config.server_url} ({resp.http_version})"
+                )
+            else:
+                logger.error(f"VLA server unhealthy: {resp.status_code}")
         except Exception as e:
             logger.error(f"Failed to connect to VLA server: {e}")
             
@@ -62,59 +89,73 @@ class VLAClient:
         # Process camera frames
         for cam_name, frame in frames.items():
             if frame is not None:
-                # Resize to model input size
-                resized = cv2.resize(frame, self.config.image_size)
-                # Normalize to [0, 1]
-                normalized = resized.astype(np.float32) / 255.0
-                processed['images'][cam_name] = normalized.tolist()
+                # Ship JPEG; the server decodes, resizes to image_size and
+                # normalizes on its GPU
+                ok, encoded = cv2.imencode(
+                    '.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, self.config.jpeg_quality]
+                )
+                if not ok:
+                    logger.warning(f"Failed to encode frame from {cam_name}")
+                    continue
+                processed['images'][cam_name] = {
+                    'encoding': 'jpeg',
+                    'size': list(self.config.image_size),
+                    'data': base64.b64encode(encoded).decode('ascii')
+                }
                 
-        # Add robot proprioception
+        # Add robot proprioception as one flat float32 array laid out as
+        # [joint_positions..., joint_velocities..., gripper_position]. It is
+        # allocated per observation since the history buffer keeps it.
         if robot_state:
-            processed['proprioception'] = [
-                robot_state.get('joint_positions', []),
-                robot_state.get('joint_velocities', []),
-                [robot_state.get('gripper_position', 0.0)]
-            ]
+            positions = robot_state.get('joint_positions', ())
+            velocities = robot_state.get('joint_velocities', ())
+            n_pos, n_vel = len(positions), len(velocities)
+            proprio = np.empty(n_pos + n_vel + 1, dtype=np.float32)
+            proprio[:n_pos] = positions
+            proprio[n_pos:n_pos + n_vel] = velocities
+            proprio[-1] = robot_state.get('gripper_position', 0.0)
+            processed['proprioception'] = proprio
             
         return processed
         
     async def infer_action(self, observation: Dict) -> Optional[np.ndarray]:
         """Send observation to VLA server and get action."""
-        if not self.session:
+        if not self.client:
             return None
             
-        # Add to observation buffer
+        # Add to observation buffer; the deque drops the oldest entry
         self.observation_buffer.append(observation)
-        if len(self.observation_buffer) > self.config.observation_history:
-            self.observation_buffer.pop(0)
             
-        # Prepare request
+        # Prepare request (orjson does not serialize deques)
         request_data = {
-            'observations': self.observation_buffer,
+            'observations': list(self.observation_buffer),
             'model': self.config.model_type,
             'action_chunk_size': self.config.action_chunk_size
         }
         
         try:
-            async with self.session.post(
+            body = orjson.dumps(request_data, option=orjson.OPT_SERIALIZE_NUMPY)
+            resp = await self.client.post(
                 f"{self.config.server_url}/infer",
-                json=request_data,
-                timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-            ) as resp:
-                if resp.status == 200:
-                    result = await resp.json()
-                    actions = np.array(result['actions'])
-                    
-                    # Store action chunk
-                    self.action_buffer = actions
-                    self.last_inference_time = time.time()
-                    
-                    return actions
-                else:
-                    logger.error(f"Inference failed: {resp.status}")
-                    return None
+                content=body,
+                headers=_JSON_HEADERS
+            )
+            if resp.status_code == 200:
+                # Raw float32 action chunk shaped by the X-Shape header
+                shape = tuple(int(n) for n in resp.headers['X-Shape'].split(','))
+                actions = np.frombuffer(resp.content, dtype='<f4').reshape(shape)
+                
+                # Store action chunk
+                self.action_buffer = actions
+                self._action_idx = 0
+                self.last_inference_time = time.time()
+                
+                return actions
+            else:
+                logger.error(f"Inference failed: {resp.status_code}")
+                return None
                     
-        except asyncio.TimeoutError:
+        except httpx.TimeoutException:
             logger.warning("VLA inference timeout")
             return None
         except Exception as e:
@@ -123,14 +164,15 @@ class VLAClient:
             
     def get_next_action(self) -> Optional[np.ndarray]:
         """Get next action from buffer (for 200Hz control)."""
-        if len(self.action_buffer) > 0:
-            # Pop first action from chunk
-            action = self.action_buffer[0]
-            self.action_buffer = self.action_buffer[1:]
+        if self._action_idx < len(self.action_buffer):
+            # Advance through the chunk without copying it
+            action = self.action_buffer[self._action_idx]
+            self._action_idx += 1
             return action
         return None
         
     async def cleanup(self):
         """Clean up resources."""
-        if self.session:
-            await self.session.close()
+        if self.client:
+            await self.client.aclose()
+            self.client = None
@@ -11,10 +11,23 @@ import numpy.typing as npt
 import yaml
 import argparse
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, Dict, Any
 import sys
 
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,11 +36,172 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _project_points_kernel(
+        objp: npt.NDArray[np.float64],
+        R: npt.NDArray[np.float64],
+        t: npt.NDArray[np.float64],
+        mtx: npt.NDArray[np.float64],
+        k: npt.NDArray[np.float64],
+        out: npt.NDArray[np.float64]
+    ) -> None:
+        """Pinhole projection with Brown-Conrady distortion, one pose per thread."""
+        fx, fy, cx, cy = mtx[0, 0], mtx[1, 1], mtx[0, 2], mtx[1, 2]
+        k1, k2, p1, p2, k3 = k[0], k[1], k[2], k[3], k[4]
+        for n in prange(R.shape[0]):
+            for p in range(objp.shape[0]):
+                X, Y, Z = objp[p, 0], objp[p, 1], objp[p, 2]
+                xc = R[n, 0, 0] * X + R[n, 0, 1] * Y + R[n, 0, 2] * Z + t[n, 0]
+                yc = R[n, 1, 0] * X + R[n, 1, 1] * Y + R[n, 1, 2] * Z + t[n, 1]
+                zc = R[n, 2, 0] * X + R[n, 2, 1] * Y + R[n, 2, 2] * Z + t[n, 2]
+                x = xc / zc
+                y = yc / zc
+                r2 = x * x + y * y
+                radial = 1.0 + r2 * (k1 + r2 * (k2 + r2 * k3))
+                xd = x * radial + 2.0 * p1 * x * y + p2 * (r2 + 2.0 * x * x)
+                yd = y * radial + p1 * (r2 + 2.0 * y * y) + 2.0 * p2 * x * y
+                out[n, p, 0] = fx * xd + cx
+                out[n, p, 1] = fy * yd + cy
+
+
+def project_points(
+    objp: npt.NDArray[np.float32],
+    rvecs: npt.NDArray[np.float64],
+    tvecs: npt.NDArray[np.float64],
+    mtx: npt.NDArray[np.float64],
+    dist: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    Project 3D points into many poses with the pinhole model and
+    Brown-Conrady distortion.
+    
+    Equivalent to cv2.projectPoints per pose for the 5-coefficient model,
+    but all poses are projected in one batched pass and no Jacobian is built.
+    Uses a parallel Numba kernel when available, otherwise NumPy.
+    
+    Args:
+        objp: (P, 3) object points shared by every pose
+        rvecs: (N, 3) Rodrigues rotation vectors
+        tvecs: (N, 3) translation vectors
+        mtx: 3x3 camera matrix
+        dist: Distortion coefficients (k1, k2, p1, p2, k3)
+        
+    Returns:
+        (N, P, 2) image points
+    """
+    rvecs = np.asarray(rvecs, dtype=np.float64).reshape(-1, 3)
+    tvecs = np.asarray(tvecs, dtype=np.float64).reshape(-1, 3)
+    R = np.stack([cv2.Rodrigues(rvec)[0] for rvec in rvecs])
+    k = np.zeros(5)
+    coeffs = np.ravel(dist)[:5]
+    k[:len(coeffs)] = coeffs
+    
+    if NUMBA_AVAILABLE:
+        out = np.empty((len(R), len(objp), 2))
+        _project_points_kernel(
+            np.ascontiguousarray(objp, dtype=np.float64), R, tvecs, 
+            np.asarray(mtx, dtype=np.float64), k, out
+        )
+        return out
+        
+    Xc = np.einsum('nij,pj->npi', R, objp.astype(np.float64)) + tvecs[:, None, :]
+    x = Xc[..., 0] / Xc[..., 2]
+    y = Xc[..., 1] / Xc[..., 2]
+    
+    k1, k2, p1, p2, k3 = k
+    r2 = x * x + y * y
+    radial = 1 + r2 * (k1 + r2 * (k2 + r2 * k3))
+    xd = x * radial + 2 * p1 * x * y + p2 * (r2 + 2 * x * x)
+    yd = y * radial + p1 * (r2 + 2 * y * y) + 2 * p2 * x * y
+    
+    return np.stack((mtx[0, 0] * xd + mtx[0, 2], mtx[1, 1] * yd + mtx[1, 2]), axis=-1)
+
+
+# Minimum time between calibration preview repaints (30 Hz)
+_PREVIEW_INTERVAL_S = 1.0 / 30
+
+# Pause between reads after a failed one (one frame at 30 fps), so a
+# disconnected camera is not polled in a tight loop
+_READ_RETRY_S = 1.0 / 30
+
+# OpenCV threads for per-frame detection; waking a pool of every core costs
+# more than it saves on half-resolution frames
+_DETECTION_NUM_THREADS = 2
+
+
 class CalibrationError(Exception):
     """Custom exception for calibration errors."""
     pass
 
 
+class _GrabThread:
+    """Read a capture continuously on a daemon thread, keeping only the newest frame."""
+    
+    def __init__(self, cap: cv2.VideoCapture) -> None:
+        """
+        Start grabbing.
+        
+        Args:
+            cap: Opened video capture, read only by this thread from now on
+        """
+        self.cap = cap
+        self.consecutive_failures = 0
+        self._frame: Optional[npt.NDArray[np.uint8]] = None
+        self._seq = 0
+        self._running = True
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="CalibrationGrab")
+        self._thread.start()
+        
+    def _run(self) -> None:
+        """Replace the held frame with every newly read one."""
+        while self._running:
+            ret, frame = self.cap.read()
+            with self._cond:
+                if ret and frame is not None:
+                    self._frame = frame
+                    self._seq += 1
+                    self.consecutive_failures = 0
+                    self._cond.notify_all()
+                    continue
+                self.consecutive_failures += 1
+                self._cond.notify_all()
+                self._cond.wait(_READ_RETRY_S)
+                
+    def next_frame(
+        self, 
+        seq: int, 
+        timeout: float = 1.0
+    ) -> Tuple[Optional[npt.NDArray[np.uint8]], int]:
+        """
+        Wait for a frame newer than seq.
+        
+        Args:
+            seq: Sequence number returned by the previous call (0 initially)
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            Tuple of (newest frame or None if none arrived, its sequence number);
+            a failed read ends the wait early with no frame
+        """
+        with self._cond:
+            failures = self.consecutive_failures
+            self._cond.wait_for(
+                lambda: self._seq != seq or self.consecutive_failures > failures, timeout
+            )
+            if self._seq == seq:
+                return None, seq
+            return self._frame, self._seq
+            
+    def stop(self) -> None:
+        """Stop grabbing and wait for the thread to exit."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
+
+
 class CameraCalibrator:
     """Camera calibration utility for intrinsic and extrinsic parameters."""
     
@@ -55,6 +229,12 @@ class CameraCalibrator:
         self.camera_id = camera_id
         self.pattern_size = calibration_pattern
         self.square_size = square_size  # Size in meters
+        
+        # Checkerboard corners in board coordinates, x varying fastest to match
+        # the detector's corner order; shared read-only by every capture
+        width, height = calibration_pattern
+        self._objp = np.zeros((width * height, 3), np.float32)
+        self._objp[:, :2] = np.indices((height, width))[::-1].reshape(2, -1).T * square_size
         self.cap: Optional[cv2.VideoCapture] = None
         
     def _validate_camera_connection(self) -> None:
@@ -64,6 +244,69 @@ class CameraCalibrator:
             raise CalibrationError(f"Cannot open camera {self.camera_id}")
         test_cap.release()
         
+    @staticmethod
+    def _to_gray(
+        frame: npt.NDArray[np.uint8], 
+        frame_size: Tuple[int, int]
+    ) -> npt.NDArray[np.uint8]:
+        """
+        Get the grayscale detection image of a captured frame.
+        
+        Args:
+            frame: BGR frame, or raw packed YUYV when the backend honours
+                CAP_PROP_CONVERT_RGB=0
+            frame_size: Capture size as (width, height)
+            
+        Returns:
+            Full-resolution grayscale image
+        """
+        if frame.ndim == 3 and frame.shape[2] == 3:
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            
+        width, height = frame_size
+        if frame.size != width * height * 2:
+            raise CalibrationError(f"Unexpected raw frame of {frame.size} bytes for {width}x{height} YUYV")
+        # The Y samples already are the grayscale image
+        return np.ascontiguousarray(frame.reshape(height, width, 2)[..., 0])
+    
+    @staticmethod
+    def _render_status(
+        images_captured: int, 
+        num_images: int, 
+        found: bool
+    ) -> npt.NDArray[np.uint8]:
+        """
+        Render the calibration status caption strip.
+        
+        Args:
+            images_captured: Images captured so far
+            num_images: Images to capture
+            found: Whether the pattern is visible
+            
+        Returns:
+            BGR caption strip
+        """
+        tile = np.zeros((70, 500, 3), dtype=np.uint8)
+        cv2.putText(
+            tile, 
+            f"Images: {images_captured}/{num_images} - {'Pattern found' if found else 'No pattern'}", 
+            (10, 30), 
+            cv2.FONT_HERSHEY_SIMPLEX, 
+            0.7, 
+            (0, 255, 0) if found else (0, 0, 255),  # Green when found, red otherwise
+            2
+        )
+        cv2.putText(
+            tile,
+            "Press SPACE to capture, ESC to finish",
+            (10, 60),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.5,
+            (255, 255, 255),
+            1
+        )
+        return tile
+    
     def calibrate_intrinsics(self, num_images: int = 20) -> Optional[Dict[str, Any]]:
         """
         Calibrate camera intrinsics using checkerboard pattern.
@@ -80,8 +323,12 @@ class CameraCalibrator:
         # Validate camera before starting
         self._validate_camera_connection()
         
+        grabber: Optional[_GrabThread] = None
+        num_threads = cv2.getNumThreads()
         try:
-            self.cap = cv2.VideoCapture(self.camera_id)
+            # V4L2 streams through mmap buffers with the least driver queuing
+            backend = cv2.CAP_V4L2 if sys.platform.startswith('linux') else cv2.CAP_ANY
+            self.cap = cv2.VideoCapture(self.camera_id, backend)
             
             if not self.cap.isOpened():
                 raise CalibrationError(f"Failed to open camera {self.camera_id}")
@@ -90,76 +337,89 @@ class CameraCalibrator:
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
             self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            # Ask for raw YUYV so the luma plane can be used for detection
+            # without a color conversion; backends that ignore this keep BGR
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'YUYV'))
+            self.cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+            frame_size = (
+                int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            )
             
-            # Prepare object points
-            objp = np.zeros((self.pattern_size[0] * self.pattern_size[1], 3), np.float32)
-            objp[:, :2] = np.mgrid[0:self.pattern_size[0], 0:self.pattern_size[1]].T.reshape(-1, 2)
-            objp *= self.square_size
-            
-            objpoints: List[npt.NDArray[np.float32]] = []  # 3D points in real world
-            imgpoints: List[npt.NDArray[np.float32]] = []  # 2D points in image plane
+            # 2D points in image plane, one contiguous row per capture; every
+            # capture shares the 3D points in self._objp
+            imgpoints = np.empty((num_images, len(self._objp), 1, 2), dtype=np.float32)
             
             logger.info("Starting calibration. Press SPACE to capture, ESC to finish.")
             images_captured = 0
+            # Corners are detected on a half-resolution image and refined with
+            # cornerSubPix on the full-resolution one
+            sb_flags = cv2.CALIB_CB_NORMALIZE_IMAGE | cv2.CALIB_CB_EXHAUSTIVE
             criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 30, 0.001)
             
             frame_shape = None
-            consecutive_failures = 0
             max_consecutive_failures = 30
             
+            # Reading on a separate thread keeps the driver queue drained, so
+            # detection always runs on the newest frame
+            grabber = _GrabThread(self.cap)
+            seq = 0
+            last_shown = 0.0
+            status_tiles: Dict[Tuple[int, bool], npt.NDArray[np.uint8]] = {}
+            cv2.setNumThreads(_DETECTION_NUM_THREADS)
+            
             while images_captured < num_images:
-                ret, frame = self.cap.read()
-                if not ret or frame is None:
-                    consecutive_failures += 1
-                    if consecutive_failures > max_consecutive_failures:
+                frame, seq = grabber.next_frame(seq)
+                if frame is None:
+                    if grabber.consecutive_failures > max_consecutive_failures:
                         logger.error("Too many consecutive read failures")
                         break
                     continue
                     
-                consecutive_failures = 0
-                frame_shape = frame.shape[:2]
-                    
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                ret, corners = cv2.findChessboardCorners(gray, self.pattern_size, None)
+                gray = self._to_gray(frame, frame_size)
+                frame_shape = gray.shape
                 
-                display_frame = frame.copy()
-                
-                if ret:
-                    # Refine corner positions
-                    corners_refined = cv2.cornerSubPix(
-                        gray, corners, (11, 11), (-1, -1), criteria
+                small = cv2.resize(gray, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+                # Reject frames without a board in milliseconds (the
+                # CALIB_CB_FAST_CHECK test) before the full detection
+                ret, corners_refined = False, None
+                if cv2.checkChessboard(small, self.pattern_size):
+                    ret, corners = cv2.findChessboardCornersSB(
+                        small, self.pattern_size, flags=sb_flags
                     )
-                    cv2.drawChessboardCorners(display_frame, self.pattern_size, corners_refined, ret)
-                    status_color = (0, 255, 0)  # Green when pattern found
-                else:
-                    status_color = (0, 0, 255)  # Red when pattern not found
-                    
-                # Display status
-                cv2.putText(
-                    display_frame, 
-                    f"Images: {images_captured}/{num_images} - {'Pattern found' if ret else 'No pattern'}", 
-                    (10, 30), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 
-                    0.7, 
-                    status_color, 
-                    2
-                )
-                cv2.putText(
-                    display_frame,
-                    "Press SPACE to capture, ESC to finish",
-                    (10, 60),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.5,
-                    (255, 255, 255),
-                    1
-                )
+                    if ret:
+                        # Map half-resolution pixel centres back to full resolution
+                        corners = (corners.reshape(-1, 1, 2) + 0.5) * 2.0 - 0.5
+                        corners_refined = cv2.cornerSubPix(
+                            gray, corners, (11, 11), (-1, -1), criteria
+                        )
                 
-                cv2.imshow('Camera Calibration', display_frame)
+                # Repaint at most at the preview rate; detection above still
+                # runs on every frame so SPACE captures the freshest corners
+                now = time.monotonic()
+                if now - last_shown >= _PREVIEW_INTERVAL_S:
+                    last_shown = now
+                    # The preview is the half-resolution detection image; only
+                    # the overlays are drawn in color
+                    preview = cv2.cvtColor(small, cv2.COLOR_GRAY2BGR)
+                    if ret:
+                        preview_corners = (corners_refined + 0.5) * 0.5 - 0.5
+                        cv2.drawChessboardCorners(preview, self.pattern_size, preview_corners, ret)
+                    
+                    # Display status from a caption strip rendered once per state
+                    tile = status_tiles.get((images_captured, ret))
+                    if tile is None:
+                        tile = self._render_status(images_captured, num_images, ret)
+                        status_tiles[(images_captured, ret)] = tile
+                    rows = min(tile.shape[0], preview.shape[0])
+                    cols = min(tile.shape[1], preview.shape[1])
+                    preview[:rows, :cols] = tile[:rows, :cols]
+                    
+                    cv2.imshow('Camera Calibration', preview)
                 
                 key = cv2.waitKey(1) & 0xFF
                 if key == ord(' ') and ret:
-                    objpoints.append(objp)
-                    imgpoints.append(corners_refined)
+                    imgpoints[images_captured] = corners_refined.reshape(-1, 1, 2)
                     images_captured += 1
                     logger.info(f"Captured calibration image {images_captured}/{num_images}")
                 elif key == 27:  # ESC
@@ -170,33 +430,47 @@ class CameraCalibrator:
             logger.error(f"Error during calibration: {e}")
             raise
         finally:
+            cv2.setNumThreads(num_threads)
+            if grabber is not None:
+                grabber.stop()
             if self.cap:
                 self.cap.release()
             cv2.destroyAllWindows()
         
-        if len(objpoints) < 5:
-            logger.warning(f"Insufficient calibration images: {len(objpoints)}. Need at least 5.")
+        if images_captured < 5:
+            logger.warning(f"Insufficient calibration images: {images_captured}. Need at least 5.")
             return None
             
         if frame_shape is None:
             logger.error("No frames captured")
             return None
             
-        logger.info(f"Calibrating with {len(objpoints)} images...")
+        logger.info(f"Calibrating with {images_captured} images...")
+        imgpoints = imgpoints[:images_captured]
         
+        # The batch fit is large enough to use every core
+        cv2.setNumThreads(cv2.getNumberOfCPUs())
         try:
             ret, mtx, dist, rvecs, tvecs = cv2.calibrateCamera(
-                objpoints, imgpoints, frame_shape[::-1], None, None
+                [self._objp] * images_captured, list(imgpoints), frame_shape[::-1], None, None
             )
+            errors = self._reprojection_errors(imgpoints, rvecs, tvecs, mtx, dist)
             
-            # Calculate reprojection error
-            total_error = 0.0
-            for i in range(len(objpoints)):
-                imgpoints2, _ = cv2.projectPoints(objpoints[i], rvecs[i], tvecs[i], mtx, dist)
-                error = cv2.norm(imgpoints[i], imgpoints2, cv2.NORM_L2) / len(imgpoints2)
-                total_error += error
+            # Drop outlier views (blur, glare) and refit on the inliers,
+            # starting from the first estimate
+            median = np.median(errors)
+            inliers = errors <= median + 2 * np.median(np.abs(errors - median))
+            num_inliers = int(inliers.sum())
+            if 5 <= num_inliers < images_captured:
+                logger.info(f"Dropping {images_captured - num_inliers} outlier calibration images")
+                imgpoints = imgpoints[inliers]
+                ret, mtx, dist, rvecs, tvecs = cv2.calibrateCamera(
+                    [self._objp] * num_inliers, list(imgpoints), frame_shape[::-1], 
+                    mtx, dist, flags=cv2.CALIB_USE_INTRINSIC_GUESS
+                )
+                errors = self._reprojection_errors(imgpoints, rvecs, tvecs, mtx, dist)
                 
-            mean_error = total_error / len(objpoints)
+            mean_error = errors.mean()
             
             calibration_data = {
                 'camera_id': self.camera_id,
@@ -204,7 +478,7 @@ class CameraCalibrator:
                 'distortion_coeffs': dist.tolist(),
                 'calibration_error': float(ret),
                 'reprojection_error': float(mean_error),
-                'num_images_used': len(objpoints),
+                'num_images_used': len(imgpoints),
                 'image_size': list(frame_shape[::-1]),
                 'pattern_size': list(self.pattern_size),
                 'square_size': self.square_size
@@ -217,11 +491,41 @@ class CameraCalibrator:
         except Exception as e:
             logger.error(f"Calibration computation failed: {e}")
             return None
+        finally:
+            cv2.setNumThreads(num_threads)
+        
+    def _reprojection_errors(
+        self,
+        imgpoints: npt.NDArray[np.float32],
+        rvecs: Tuple[npt.NDArray[np.float64], ...],
+        tvecs: Tuple[npt.NDArray[np.float64], ...],
+        mtx: npt.NDArray[np.float64],
+        dist: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        """
+        Compute the reprojection error of every calibration image at once.
+        
+        Args:
+            imgpoints: (N, P, 1, 2) detected corners
+            rvecs: Per-image rotation vectors from calibrateCamera
+            tvecs: Per-image translation vectors from calibrateCamera
+            mtx: Camera matrix
+            dist: Distortion coefficients
+            
+        Returns:
+            (N,) L2 norm of each image's residual divided by the point count
+        """
+        projected = project_points(self._objp, np.stack(rvecs), np.stack(tvecs), mtx, dist)
+        residual = imgpoints.reshape(projected.shape) - projected
+        return np.sqrt(np.einsum('npk,npk->n', residual, residual)) / projected.shape[1]
         
     def save_calibration(self, calibration_data: Dict[str, Any], filepath: str) -> None:
         """
         Save calibration data to YAML file.
         
+        An .npz copy is written next to the YAML so load_calibration() can
+        skip the YAML parser.
+        
         Args:
             calibration_data: Calibration parameters to save
             filepath: Path to output YAML file
@@ -243,7 +547,13 @@ class CameraCalibrator:
         
         try:
             with open(output_path, 'w') as f:
-                yaml.dump(calibration_data, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(
+                    calibration_data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False
+                )
+            np.savez(
+                output_path.with_suffix('.npz'),
+                **{key: np.asarray(value) for key, value in calibration_data.items()}
+            )
             logger.info(f"Calibration saved to {output_path}")
         except IOError as e:
             raise CalibrationError(f"Failed to save calibration: {e}") from e
@@ -252,20 +562,29 @@ class CameraCalibrator:
         """
         Load calibration data from YAML file.
         
+        Reads the .npz copy written by save_calibration() instead when it
+        is at least as new as the YAML, so hand edits to the YAML still win.
+        
         Args:
             filepath: Path to calibration YAML file
             
         Returns:
-            Dictionary containing calibration parameters
+            Dictionary containing calibration parameters, with camera_matrix
+            and distortion_coeffs as float64 arrays
         """
         calib_path = Path(filepath)
         
         if not calib_path.exists():
             raise FileNotFoundError(f"Calibration file not found: {calib_path}")
             
+        npz_path = calib_path.with_suffix('.npz')
         try:
-            with open(calib_path, 'r') as f:
-                calibration_data = yaml.safe_load(f)
+            if npz_path.exists() and npz_path.stat().st_mtime_ns >= calib_path.stat().st_mtime_ns:
+                with np.load(npz_path) as arrays:
+                    calibration_data = {key: arrays[key].tolist() for key in arrays.files}
+            else:
+                with open(calib_path, 'r') as f:
+                    calibration_data = yaml.load(f, Loader=_YamlLoader)
                 
             if not isinstance(calibration_data, dict):
                 raise ValueError("Invalid calibration file format")
@@ -275,6 +594,7 @@ class CameraCalibrator:
             for field in required_fields:
                 if field not in calibration_data:
                     raise ValueError(f"Missing required field: {field}")
+                calibration_data[field] = np.asarray(calibration_data[field], dtype=np.float64)
                     
             return calibration_data
             
@@ -290,8 +610,8 @@ class CameraCalibrator:
         """
         calib_data = self.load_calibration(calibration_file)
         
-        mtx = np.array(calib_data['camera_matrix'])
-        dist = np.array(calib_data['distortion_coeffs'])
+        mtx = calib_data['camera_matrix']
+        dist = calib_data['distortion_coeffs']
         
         self.cap = cv2.VideoCapture(self.camera_id)
         
@@ -300,6 +620,21 @@ class CameraCalibrator:
             
         logger.info("Showing undistorted feed. Press 'q' to quit.")
         
+        # The intrinsics are fixed, so the undistortion maps only depend on
+        # the frame size; fixed-point maps halve remap's memory traffic
+        map_size: Optional[Tuple[int, int]] = None
+        
+        # Undistort on the GPU when OpenCV was built with CUDA
+        use_cuda = hasattr(cv2, 'cuda') and cv2.cuda.getCudaEnabledDeviceCount() > 0
+        if use_cuda:
+            gpu_frame = cv2.cuda_GpuMat()
+            gpu_undistorted = cv2.cuda_GpuMat()
+            logger.info("Undistorting on CUDA")
+        
+        # Side-by-side display; both halves are resized straight into it
+        display = np.empty((480, 1280, 3), dtype=np.uint8)
+        left, right = display[:, :640], display[:, 640:]
+        
         try:
             while True:
                 ret, frame = self.cap.read()
@@ -307,12 +642,32 @@ class CameraCalibrator:
                     continue
                     
                 h, w = frame.shape[:2]
-                newcameramtx, roi = cv2.getOptimalNewCameraMatrix(
-                    mtx, dist, (w, h), 1, (w, h)
-                )
+                if map_size != (w, h):
+                    newcameramtx, roi = cv2.getOptimalNewCameraMatrix(
+                        mtx, dist, (w, h), 1, (w, h)
+                    )
+                    if use_cuda:
+                        # cuda.remap takes separate float x and y maps, kept
+                        # on the device
+                        xmap, ymap = cv2.initUndistortRectifyMap(
+                            mtx, dist, None, newcameramtx, (w, h), cv2.CV_32FC1
+                        )
+                        map1, map2 = cv2.cuda_GpuMat(), cv2.cuda_GpuMat()
+                        map1.upload(xmap)
+                        map2.upload(ymap)
+                    else:
+                        map1, map2 = cv2.initUndistortRectifyMap(
+                            mtx, dist, None, newcameramtx, (w, h), cv2.CV_16SC2
+                        )
+                    map_size = (w, h)
                 
                 # Undistort
-                undistorted = cv2.undistort(frame, mtx, dist, None, newcameramtx)
+                if use_cuda:
+                    gpu_frame.upload(frame)
+                    cv2.cuda.remap(gpu_frame, map1, map2, cv2.INTER_LINEAR, dst=gpu_undistorted)
+                    undistorted = gpu_undistorted.download()
+                else:
+                    undistorted = cv2.remap(frame, map1, map2, cv2.INTER_LINEAR)
                 
                 # Crop the image
                 x, y, w, h = roi
@@ -320,10 +675,8 @@ class CameraCalibrator:
                     undistorted = undistorted[y:y+h, x:x+w]
                 
                 # Show both original and undistorted
-                display = np.hstack([
-                    cv2.resize(frame, (640, 480)),
-                    cv2.resize(undistorted, (640, 480))
-                ])
+                cv2.resize(frame, (640, 480), dst=left)
+                cv2.resize(undistorted, (640, 480), dst=right)
                 
                 cv2.putText(
                     display,
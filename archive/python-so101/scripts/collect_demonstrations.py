@@ -6,21 +6,28 @@ Synchronized camera and robot state recording for SO-101 arms.
 """
 
 import asyncio
-import aiofiles
 import cv2
 import numpy as np
+import numpy.typing as npt
 import json
+import os
 import time
 import pickle
 import logging
 from pathlib import Path
 from datetime import datetime
 import yaml
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Iterator, Callable
 import sys
 import threading
 from concurrent.futures import ThreadPoolExecutor
 
+try:
+    import blosc2
+    BLOSC2_AVAILABLE = True
+except ImportError:
+    BLOSC2_AVAILABLE = False
+
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -34,11 +41,285 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Steps per preallocated chunk of an episode's frame and action buffers
+_CHUNK_STEPS = 256
+
+# Episode frame storage: JPEG-encoded images, or lossless raw arrays
+FRAME_FORMATS = ("jpeg", "raw")
+_JPEG_QUALITY = 90
+_PNG_COMPRESSION = 1
+
+# Control/recording loop period (200 Hz)
+_CONTROL_PERIOD_S = 0.005
+
+# Minimum seconds between repeated "no frames" warnings from record_step
+_NO_FRAMES_LOG_INTERVAL_S = 1.0
+
+# Camera types whose capture size can be set to the VLA frame size; other
+# cameras (RealSense, IP streams) only offer fixed modes
+_CAPTURE_SIZE_TYPES = ("opencv", "usb")
+
+
 class DemonstrationError(Exception):
     """Custom exception for demonstration collection errors."""
     pass
 
 
+class _ChunkedArray:
+    """Append-only array grown in preallocated fixed-size chunks."""
+    
+    def __init__(
+        self, 
+        item_shape: Tuple[int, ...], 
+        dtype: npt.DTypeLike, 
+        chunk_len: int = _CHUNK_STEPS
+    ) -> None:
+        """
+        Initialize an empty array.
+        
+        Args:
+            item_shape: Shape of each element
+            dtype: Element dtype
+            chunk_len: Elements allocated at a time
+        """
+        self.item_shape = tuple(item_shape)
+        self.dtype = np.dtype(dtype)
+        self.chunk_len = chunk_len
+        self._chunks: List[npt.NDArray[Any]] = []
+        self._len = 0
+        # Elements handed off by take_chunks() and no longer held
+        self._taken = 0
+        
+    def __len__(self) -> int:
+        return self._len
+        
+    def _reserve(self) -> Tuple[npt.NDArray[Any], int]:
+        """Reserve the next element, returning its chunk and index in it."""
+        index = self._len % self.chunk_len
+        if index == 0:
+            self._chunks.append(np.empty((self.chunk_len,) + self.item_shape, dtype=self.dtype))
+        self._len += 1
+        return self._chunks[-1], index
+        
+    def next_slot(self) -> npt.NDArray[Any]:
+        """Reserve the next element and return it as a writable view."""
+        chunk, index = self._reserve()
+        return chunk[index]
+        
+    def append(self, value: Any) -> None:
+        """Append one element."""
+        chunk, index = self._reserve()
+        chunk[index] = value
+        
+    def chunks(self) -> Iterator[npt.NDArray[Any]]:
+        """Yield views of the filled part of every held chunk, in order."""
+        for i, chunk in enumerate(self._chunks):
+            yield chunk[:min(self.chunk_len, self._len - self._taken - i * self.chunk_len)]
+            
+    def take_chunks(self) -> List[npt.NDArray[Any]]:
+        """
+        Hand off the held chunks, which must all be full, and drop them.
+        
+        Returns:
+            The chunks in order; later elements go into new chunks
+        """
+        chunks, self._chunks = self._chunks, []
+        self._taken = self._len
+        return chunks
+            
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickle as the equivalent ndarray.
+        
+        The filled chunk views are pickled as they are and concatenated on
+        load, so saving never builds the contiguous array. With protocol 5
+        each chunk is written straight from its memory to the file.
+        """
+        chunks = tuple(self.chunks())
+        if not chunks:
+            return (np.empty, ((0,) + self.item_shape, self.dtype))
+        return (np.concatenate, (chunks,))
+        
+    def to_array(self) -> npt.NDArray[Any]:
+        """Copy the held elements into one contiguous array."""
+        out = np.empty((self._len - self._taken,) + self.item_shape, dtype=self.dtype)
+        start = 0
+        for chunk in self.chunks():
+            out[start:start + len(chunk)] = chunk
+            start += len(chunk)
+        return out
+
+
+def _encode_frame(frame: npt.NDArray[np.uint8]) -> Tuple[bytes, Optional[bytes]]:
+    """
+    Encode one frame as JPEG, with any fourth (depth) channel as PNG.
+    
+    Args:
+        frame: (H, W), (H, W, 3) or (H, W, 4) uint8 frame
+        
+    Returns:
+        JPEG bytes of the image, and PNG bytes of the depth channel or None
+    """
+    depth = None
+    if frame.ndim == 3 and frame.shape[2] == 4:
+        ok, png = cv2.imencode(
+            '.png', np.ascontiguousarray(frame[..., 3]),
+            [int(cv2.IMWRITE_PNG_COMPRESSION), _PNG_COMPRESSION]
+        )
+        if not ok:
+            raise DemonstrationError("PNG encoding failed")
+        depth = png.tobytes()
+        frame = np.ascontiguousarray(frame[..., :3])
+        
+    ok, jpeg = cv2.imencode('.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), _JPEG_QUALITY])
+    if not ok:
+        raise DemonstrationError("JPEG encoding failed")
+    return jpeg.tobytes(), depth
+
+
+def _pack_buffers(buffers: List[bytes]) -> Tuple[bytes, npt.NDArray[np.int64]]:
+    """Concatenate encoded buffers, returning the data and (N + 1) offsets."""
+    offsets = np.zeros(len(buffers) + 1, dtype=np.int64)
+    np.cumsum([len(buf) for buf in buffers], out=offsets[1:])
+    return b''.join(buffers), offsets
+
+
+def decode_frames(camera: Dict[str, Any]) -> npt.NDArray[np.uint8]:
+    """
+    Decode a camera's JPEG-encoded frames from a saved episode.
+    
+    Args:
+        camera: Camera entry of an episode pickle saved with the "jpeg"
+            frame format
+        
+    Returns:
+        (T, H, W[, C]) uint8 frames, with depth restored as the fourth
+        channel when it was recorded
+    """
+    def unpack(data: bytes, offsets: npt.NDArray[np.int64]) -> List[npt.NDArray[np.uint8]]:
+        buf = np.frombuffer(data, dtype=np.uint8)
+        return [
+            cv2.imdecode(buf[start:end], cv2.IMREAD_UNCHANGED)
+            for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+        ]
+        
+    images = unpack(camera['jpeg'], camera['jpeg_offsets'])
+    if not images:
+        return np.empty((0,), dtype=np.uint8)
+    frames = np.stack(images)
+    if 'depth_png' in camera:
+        depth = np.stack(unpack(camera['depth_png'], camera['depth_offsets']))
+        frames = np.concatenate([frames, depth[..., np.newaxis]], axis=-1)
+    return frames
+
+
+class _JpegStream:
+    """JPEG-encodes an episode's frames chunk by chunk while it records."""
+    
+    def __init__(self, pool: ThreadPoolExecutor) -> None:
+        """
+        Initialize an empty stream.
+        
+        Args:
+            pool: Executor frames are encoded on in parallel
+        """
+        self._pool = pool
+        self.images: List[bytes] = []
+        self.depths: List[bytes] = []
+        
+    def append(self, block: npt.NDArray[np.uint8]) -> None:
+        """Encode a block of frames (stream writer thread only)."""
+        for image, depth in self._pool.map(_encode_frame, block):
+            self.images.append(image)
+            if depth is not None:
+                self.depths.append(depth)
+                
+    def close(self) -> None:
+        """Nothing to flush; the encoded frames are pickled on save."""
+
+
+class _Blosc2Stream:
+    """Appends an episode's frames chunk by chunk to a Blosc2 array on disk."""
+    
+    # Target bytes per Blosc2 chunk of the on-disk array
+    CHUNK_BYTES = 4 << 20
+    
+    def __init__(self, path: Path, item_shape: Tuple[int, ...], dtype: npt.DTypeLike) -> None:
+        """
+        Initialize the stream; the file is created on the first write.
+        
+        Args:
+            path: .b2nd file to write
+            item_shape: Shape of each frame
+            dtype: Frame dtype
+        """
+        self.path = path
+        self.item_shape = tuple(item_shape)
+        self.dtype = np.dtype(dtype)
+        self._array = None
+        
+    def _open(self) -> None:
+        """Create the growable (0, *item_shape) array."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        rows = max(1, self.CHUNK_BYTES // (int(np.prod(self.item_shape)) * self.dtype.itemsize))
+        self._array = blosc2.empty(
+            (0,) + self.item_shape, dtype=self.dtype,
+            chunks=(rows,) + self.item_shape,
+            urlpath=str(self.path), mode='w', cparams=_blosc2_cparams()
+        )
+        
+    def append(self, block: npt.NDArray[Any]) -> None:
+        """Append a block of frames (stream writer thread only)."""
+        if self._array is None:
+            self._open()
+        start = self._array.shape[0]
+        self._array.resize((start + len(block),) + self.item_shape)
+        self._array[start:] = block
+        
+    def close(self) -> None:
+        """Make sure the file exists and drop the array handle."""
+        if self._array is None:
+            self._open()
+        self._array = None
+
+
+def _blosc2_cparams() -> Dict[str, Any]:
+    """Compression used for every Blosc2 array of an episode."""
+    return {
+        'codec': blosc2.Codec.ZSTD,
+        'clevel': 3,
+        'filters': [blosc2.Filter.SHUFFLE],
+        'nthreads': 4
+    }
+
+
+class _DeadlineTicker:
+    """Paces a loop against absolute monotonic deadlines so step time does not drift the rate."""
+    
+    def __init__(self, period: float) -> None:
+        """
+        Initialize the ticker; the first deadline is one period from now.
+        
+        Args:
+            period: Loop period in seconds
+        """
+        self.period = period
+        self._start = time.monotonic()
+        self._tick = 0
+        
+    async def wait(self) -> None:
+        """Sleep until the next deadline, skipping ticks after an overrun."""
+        self._tick += 1
+        delay = self._start + self._tick * self.period - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        elif delay < -self.period:
+            # Resume on the schedule rather than bursting to catch up
+            missed = int(-delay / self.period)
+            self._tick += missed
+            logger.warning(f"Control loop overran by {-delay * 1000:.1f} ms, skipping {missed} ticks")
+
+
 class DemonstrationCollector:
     """Collects synchronized demonstration data from cameras and robot."""
     
@@ -73,6 +354,23 @@ class DemonstrationCollector:
                 
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        self.frame_format = self.config.get('recording', {}).get('frame_format', 'jpeg')
+        if self.frame_format not in FRAME_FORMATS:
+            raise ValueError(f"Unknown frame format: {self.frame_format}")
+            
+        # VLA frame size as (width, height); cameras capture at it directly
+        # unless marked record_native
+        resize_config = self.config.get('vla_integration', {}).get('resize_to')
+        self._target_size: Optional[Tuple[int, int]] = (
+            tuple(resize_config) if resize_config and len(resize_config) == 2 else None
+        )
+        self._native_cameras = frozenset(
+            name for name, cam_cfg in self.config.get('cameras', {}).items()
+            if isinstance(cam_cfg, dict) and cam_cfg.get('record_native', False)
+        )
+        
+        self._last_no_frames_log = 0.0
+        
         self.camera_manager: Optional[CameraManager] = None
         self.recording = False
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -84,10 +382,17 @@ class DemonstrationCollector:
         }
         self._lock = threading.RLock()
         self._executor = ThreadPoolExecutor(max_workers=4)
+        # Full frame chunks are handed to one stream writer thread while the
+        # episode records, so writes stay in order and memory holds only the
+        # chunk being filled; frames JPEG-encode on the encode pool
+        self._stream_executor = ThreadPoolExecutor(max_workers=1)
+        self._encode_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
         
     async def initialize(self) -> None:
         """Initialize camera manager with configuration."""
         try:
+            # Leave half the cores to the capture threads
+            cv2.setNumThreads(max(1, (os.cpu_count() or 2) // 2))
             self.camera_manager = CameraManager()
             
             # Add cameras from config
@@ -96,15 +401,41 @@ class DemonstrationCollector:
                     logger.warning(f"Invalid camera config for {cam_name}")
                     continue
                     
+                # Capture USB cameras at the VLA size when the driver offers
+                # exactly that mode, so frames need no resize; otherwise keep
+                # the configured resolution and record_step resizes on the host
+                width = cam_cfg.get('width', 1280)
+                height = cam_cfg.get('height', 720)
+                device_id = cam_cfg.get('index_or_path', 0)
+                if (
+                    self._target_size is not None
+                    and cam_name not in self._native_cameras
+                    and str(cam_cfg.get('type', 'opencv')).lower() in _CAPTURE_SIZE_TYPES
+                ):
+                    if self._supports_capture_size(device_id, self._target_size):
+                        width, height = self._target_size
+                    else:
+                        logger.info(
+                            f"{cam_name} cannot capture at {self._target_size[0]}x"
+                            f"{self._target_size[1]}; resizing from {width}x{height}"
+                        )
+                    
                 try:
                     self.camera_manager.add_camera(
                         name=cam_name,
                         camera_type=cam_cfg.get('type', 'opencv'),
-                        device_id=cam_cfg.get('index_or_path', 0),
-                        width=cam_cfg.get('width', 1280),
-                        height=cam_cfg.get('height', 720),
+                        device_id=device_id,
+                        width=width,
+                        height=height,
                         fps=cam_cfg.get('fps', 30),
-                        mount_position=cam_cfg.get('mount', 'wrist')
+                        mount_position=cam_cfg.get('mount', 'wrist'),
+                        backend=cam_cfg.get('backend', 'opencv'),
+                        drop_policy=cam_cfg.get('drop_policy', 'keep_all'),
+                        # Capture processes write frames into shared memory
+                        # that record_step copies from directly
+                        capture_process=cam_cfg.get('capture_process', False),
+                        # Single-buffered so every step sees the newest frame
+                        buffer_size=cam_cfg.get('buffer_size', 1)
                     )
                 except Exception as e:
                     logger.error(f"Failed to add camera {cam_name}: {e}")
@@ -117,6 +448,35 @@ class DemonstrationCollector:
         except Exception as e:
             raise DemonstrationError(f"Failed to initialize cameras: {e}") from e
         
+    @staticmethod
+    def _supports_capture_size(device_id: Any, size: Tuple[int, int]) -> bool:
+        """
+        Check whether a USB camera negotiates exactly the given capture size.
+        
+        Args:
+            device_id: Camera index
+            size: Requested (width, height)
+            
+        Returns:
+            True if the driver reports that size after setting it
+        """
+        try:
+            index = int(device_id)
+        except (ValueError, TypeError):
+            return False
+            
+        cap = cv2.VideoCapture(index)
+        try:
+            if not cap.isOpened():
+                return False
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, size[0])
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, size[1])
+            negotiated = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+            return negotiated == tuple(size)
+        finally:
+            cap.release()
+            
     async def start_episode(self, task_name: str = "task") -> int:
         """
         Start recording a new episode.
@@ -139,9 +499,14 @@ class DemonstrationCollector:
                 'episode_id': episode_id,
                 'task': task_name,
                 'start_time': timestamp,
-                'frames': [],
-                'actions': [],
-                'states': []
+                # Per-camera frame buffers with the step of each frame, and
+                # per-step timestamps; actions are sized on the first one
+                'cameras': {},
+                'timestamps': _ChunkedArray((), np.float64),
+                'actions': None,
+                'states': [],
+                # Stream writes queued so far, waited on before saving
+                'pending_writes': []
             }
             
             # Start video recording if configured
@@ -155,7 +520,7 @@ class DemonstrationCollector:
     async def record_step(
         self, 
         robot_state: Dict[str, Any], 
-        action: Optional[List[float]] = None
+        action: Optional[npt.ArrayLike] = None
     ) -> None:
         """
         Record a single step with synchronized data.
@@ -170,53 +535,140 @@ class DemonstrationCollector:
         if not isinstance(robot_state, dict):
             raise TypeError("robot_state must be a dictionary")
             
-        # Get synchronized frames from all cameras
+        # Steps run far faster than the cameras, so the newest frame is the
+        # closest match; skip the buffered timestamp search
         timestamp = time.time()
-        frames = self.camera_manager.get_synchronized_frames(timestamp, tolerance=0.02)
+        frames = self.camera_manager.get_latest_frames()
         
         if not frames:
-            logger.warning("No frames available for recording")
+            now = time.monotonic()
+            if now - self._last_no_frames_log >= _NO_FRAMES_LOG_INTERVAL_S:
+                self._last_no_frames_log = now
+                logger.warning("No frames available for recording")
             return
             
-        step_data = {
-            'timestamp': timestamp,
-            'frames': {},
-            'robot_state': robot_state,
-            'action': action
-        }
+        cam_frames = [
+            (name, frame, frame_ts)
+            for name, frame, frame_ts in zip(frames.names, frames.slots, frames.timestamps)
+            if frame is not None
+        ]
         
-        # Process frames asynchronously
-        loop = asyncio.get_event_loop()
-        
-        for cam_name, frame in frames.items():
-            if frame is not None:
-                # Optionally resize for VLA
-                resize_config = self.config.get('vla_integration', {}).get('resize_to')
-                if resize_config and len(resize_config) == 2:
-                    target_size = tuple(resize_config)
-                    frame_resized = await loop.run_in_executor(
-                        self._executor,
-                        cv2.resize,
-                        frame,
-                        target_size
-                    )
-                else:
-                    frame_resized = frame
-                    
-                step_data['frames'][cam_name] = {
-                    'data': frame_resized,
-                    'shape': frame_resized.shape,
-                    'dtype': str(frame_resized.dtype),
-                    'timestamp': timestamp
+        # Copying and resizing release the GIL and take well under a
+        # millisecond, so they run inline rather than through the executor
+        self._store_step(cam_frames, self._target_size, timestamp, robot_state, action)
+        
+    def _store_step(
+        self,
+        cam_frames: List[Tuple[str, npt.NDArray[np.uint8], Optional[int]]],
+        target_size: Optional[Tuple[int, int]],
+        timestamp: float,
+        robot_state: Dict[str, Any],
+        action: Optional[npt.ArrayLike]
+    ) -> None:
+        """
+        Write one step into the episode buffers.
+        
+        Frames are copied, or resized, straight out of the camera pool into
+        the next slot of their camera's buffer without intermediate arrays.
+        Frames already at the target size and record_native cameras are
+        copied as they are. Steps run faster than the cameras, so a frame
+        whose capture timestamp matches the camera's last stored frame is
+        skipped; the per-camera step array maps frames back to steps.
+        
+        Args:
+            cam_frames: (camera name, frame, capture timestamp) triples;
+                frames are reused pool slots
+            target_size: Output size as (width, height), or None to keep size
+            timestamp: Wall-clock time of the step
+            robot_state: Robot state at this step
+            action: Optional action taken at this step
+        """
+        # Only the event loop thread records, and end_episode() clears
+        # self.recording on that same thread between steps, so the buffers
+        # need no lock
+        if not self.recording or not self.current_episode:
+            return
+        episode = self.current_episode
+        step = len(episode['states'])
+        
+        for cam_name, frame, frame_ts in cam_frames:
+            camera = episode['cameras'].get(cam_name)
+            if camera is not None and frame_ts is not None and frame_ts == camera['last_timestamp']:
+                continue
+                
+            resize = (
+                target_size is not None
+                and cam_name not in self._native_cameras
+                and frame.shape[1::-1] != target_size
+            )
+            if not resize:
+                shape = frame.shape
+            else:
+                shape = (target_size[1], target_size[0]) + frame.shape[2:]
+            if camera is None:
+                camera = episode['cameras'][cam_name] = {
+                    'frames': _ChunkedArray(shape, frame.dtype),
+                    'steps': _ChunkedArray((), np.int64),
+                    'last_timestamp': None,
+                    'stream': self._new_frame_stream(episode, cam_name, shape, frame.dtype)
                 }
+            if camera['frames'].item_shape != shape or camera['frames'].dtype != frame.dtype:
+                logger.warning(f"Skipping {cam_name} frame with changed layout {shape}")
+                continue
                 
-        with self._lock:
-            if self.recording and self.current_episode:
-                self.current_episode['frames'].append(step_data['frames'])
-                self.current_episode['states'].append(robot_state)
-                if action is not None:
-                    self.current_episode['actions'].append(action)
+            slot = camera['frames'].next_slot()
+            if not resize:
+                np.copyto(slot, frame)
+            else:
+                cv2.resize(frame, target_size, dst=slot, interpolation=cv2.INTER_AREA)
+            camera['steps'].append(step)
+            camera['last_timestamp'] = frame_ts
+            
+            frames = camera['frames']
+            if camera['stream'] is not None and len(frames) % frames.chunk_len == 0:
+                for chunk in frames.take_chunks():
+                    episode['pending_writes'].append(
+                        self._stream_executor.submit(camera['stream'].append, chunk)
+                    )
+            
+        episode['timestamps'].append(timestamp)
+        episode['states'].append(robot_state)
+        if action is not None:
+            if episode['actions'] is None:
+                episode['actions'] = _ChunkedArray((len(action),), np.float32)
+            episode['actions'].append(action)
+        
+    def _episode_dir(self, episode_id: int) -> Path:
+        """Directory an episode's files are written to."""
+        return self.output_dir / self.session_id / f"episode_{episode_id:04d}"
+        
+    def _new_frame_stream(
+        self,
+        episode: Dict[str, Any],
+        cam_name: str,
+        shape: Tuple[int, ...],
+        dtype: npt.DTypeLike
+    ) -> Optional[Any]:
+        """
+        Create the stream a camera's full frame chunks are written to.
+        
+        Args:
+            episode: Episode being recorded
+            cam_name: Camera name
+            shape: Frame shape
+            dtype: Frame dtype
             
+        Returns:
+            A _JpegStream or _Blosc2Stream, or None when frames are only
+            written on save (raw frames without Blosc2)
+        """
+        if self.frame_format == 'jpeg':
+            return _JpegStream(self._encode_pool)
+        if BLOSC2_AVAILABLE:
+            path = self._episode_dir(episode['episode_id']) / f"frames_{cam_name}.b2nd"
+            return _Blosc2Stream(path, shape, dtype)
+        return None
+        
     async def end_episode(self) -> None:
         """End current episode and save data."""
         with self._lock:
@@ -245,40 +697,38 @@ class DemonstrationCollector:
             return
             
         episode_id = self.current_episode['episode_id']
-        episode_dir = self.output_dir / self.session_id / f"episode_{episode_id:04d}"
+        episode_dir = self._episode_dir(episode_id)
         episode_dir.mkdir(parents=True, exist_ok=True)
         
         try:
-            # Save as pickle for efficient loading
-            episode_path = episode_dir / "episode_data.pkl"
+            # JPEG frames in a single pickle; raw frames go to compressed
+            # per-camera arrays when Blosc2 is installed, otherwise a pickle
+            if self.frame_format == 'jpeg':
+                episode_path = episode_dir / "episode_data.pkl"
+                save = self._save_episode_jpeg
+            elif BLOSC2_AVAILABLE:
+                episode_path = episode_dir / "episode.json"
+                save = self._save_blosc2
+            else:
+                episode_path = episode_dir / "episode_data.pkl"
+                save = self._save_episode_pickle
             
-            # Use async file I/O
-            loop = asyncio.get_event_loop()
+            # Episode and metadata writes go out as one executor job so the
+            # event loop pays a single thread hop per episode
+            metadata_path = self.output_dir / self.session_id / "metadata.json"
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(
                 self._executor,
-                self._save_pickle,
+                self._write_episode,
+                save,
                 episode_path,
+                metadata_path,
                 self.current_episode
             )
-            
-            # Update and save metadata
-            with self._lock:
-                self.metadata['episodes'].append({
-                    'episode_id': episode_id,
-                    'task': self.current_episode['task'],
-                    'start_time': self.current_episode['start_time'],
-                    'end_time': self.current_episode['end_time'],
-                    'num_steps': len(self.current_episode.get('frames', [])),
-                    'path': str(episode_path.relative_to(self.output_dir))
-                })
-            
-            metadata_path = self.output_dir / self.session_id / "metadata.json"
-            async with aiofiles.open(metadata_path, 'w') as f:
-                await f.write(json.dumps(self.metadata, indent=2))
                 
             logger.info(
                 f"Saved episode {episode_id} with "
-                f"{len(self.current_episode.get('frames', []))} steps"
+                f"{len(self.current_episode['states'])} steps"
             )
             
         except Exception as e:
@@ -287,10 +737,170 @@ class DemonstrationCollector:
         finally:
             self.current_episode = {}
             
+    def _write_episode(
+        self,
+        save: Callable[[Path, Dict[str, Any]], None],
+        episode_path: Path,
+        metadata_path: Path,
+        episode: Dict[str, Any]
+    ) -> None:
+        """Save an episode and rewrite the session metadata (for executor).
+        
+        Args:
+            save: Episode writer (_save_blosc2 or _save_episode_pickle)
+            episode_path: Destination for the episode data
+            metadata_path: Session metadata.json path
+            episode: Finished episode dictionary
+        """
+        # Frames streamed during recording must be on their way out first
+        for future in episode['pending_writes']:
+            future.result()
+        save(episode_path, episode)
+        
+        with self._lock:
+            self.metadata['episodes'].append({
+                'episode_id': episode['episode_id'],
+                'task': episode['task'],
+                'start_time': episode['start_time'],
+                'end_time': episode['end_time'],
+                'num_steps': len(episode['states']),
+                'path': str(episode_path.relative_to(self.output_dir))
+            })
+            metadata_json = json.dumps(self.metadata, indent=2)
+            
+        with open(metadata_path, 'w') as f:
+            f.write(metadata_json)
+            
     def _save_pickle(self, path: Path, data: Any) -> None:
         """Helper to save pickle file (for executor)."""
         with open(path, 'wb') as f:
             pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            
+    @staticmethod
+    def _episode_arrays(episode: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Lay out an episode's buffers as they are pickled.
+        
+        Frame buffers are left chunked; they unpickle as plain arrays (see
+        _ChunkedArray.__reduce__) without a full copy at save time.
+        
+        Args:
+            episode: Episode data as built by record_step()
+            
+        Returns:
+            Episode dict with per-camera frame and step arrays, and timestamp
+            and action arrays
+        """
+        data = {
+            key: value for key, value in episode.items() 
+            if key not in ('cameras', 'timestamps', 'actions', 'pending_writes')
+        }
+        data['num_steps'] = len(episode['states'])
+        data['timestamps'] = episode['timestamps'].to_array()
+        actions = episode['actions']
+        data['actions'] = actions.to_array() if actions is not None else np.empty((0, 0), np.float32)
+        data['cameras'] = {
+            cam_name: {
+                'frames': camera['frames'],
+                'steps': camera['steps'].to_array()
+            }
+            for cam_name, camera in episode['cameras'].items()
+        }
+        return data
+        
+    def _save_episode_pickle(self, path: Path, episode: Dict[str, Any]) -> None:
+        """Save an episode as a single pickle of plain arrays (for executor)."""
+        self._save_pickle(path, self._episode_arrays(episode))
+            
+    def _save_episode_jpeg(self, path: Path, episode: Dict[str, Any]) -> None:
+        """
+        Save an episode as a single pickle with JPEG-encoded frames (for executor).
+        
+        Each camera's frames become one concatenated JPEG buffer plus an
+        offsets array; a depth channel is stored the same way as PNG. Most
+        frames were encoded while recording; the last partial chunk is
+        encoded here. Use decode_frames() to read them back.
+        
+        Args:
+            path: Pickle path
+            episode: Episode data as built by record_step()
+        """
+        data = {
+            key: value for key, value in episode.items() 
+            if key not in ('cameras', 'timestamps', 'actions', 'pending_writes')
+        }
+        data['num_steps'] = len(episode['states'])
+        data['frame_format'] = 'jpeg'
+        data['timestamps'] = episode['timestamps'].to_array()
+        actions = episode['actions']
+        data['actions'] = actions.to_array() if actions is not None else np.empty((0, 0), np.float32)
+        data['cameras'] = {}
+        
+        for cam_name, camera in episode['cameras'].items():
+            stream = camera['stream']
+            for chunk in camera['frames'].chunks():
+                stream.append(chunk)
+                
+            jpeg, jpeg_offsets = _pack_buffers(stream.images)
+            entry = {
+                'jpeg': jpeg,
+                'jpeg_offsets': jpeg_offsets,
+                'steps': camera['steps'].to_array()
+            }
+            if stream.depths:
+                entry['depth_png'], entry['depth_offsets'] = _pack_buffers(stream.depths)
+            data['cameras'][cam_name] = entry
+                
+        self._save_pickle(path, data)
+            
+    def _save_blosc2(self, path: Path, episode: Dict[str, Any]) -> None:
+        """
+        Save an episode as Blosc2 arrays plus a JSON index (for executor).
+        
+        Each camera's frames were appended chunk by chunk to one (T, H, W, C)
+        array with Zstd and byte shuffling while recording; the last partial
+        chunk is appended here. Actions go to their own array. The index
+        holds everything else, plus the step each frame belongs to.
+        
+        Args:
+            path: Path of the JSON index; arrays are written next to it
+            episode: Episode data as built by record_step()
+        """
+        cparams = _blosc2_cparams()
+        
+        def write(filename: str, column: _ChunkedArray) -> None:
+            out = blosc2.empty(
+                (len(column),) + column.item_shape, dtype=column.dtype,
+                urlpath=str(path.parent / filename), mode='w', cparams=cparams
+            )
+            start = 0
+            for chunk in column.chunks():
+                out[start:start + len(chunk)] = chunk
+                start += len(chunk)
+                
+        index: Dict[str, Any] = {
+            key: value for key, value in episode.items() 
+            if key not in ('cameras', 'timestamps', 'actions', 'pending_writes')
+        }
+        index['num_steps'] = len(episode['states'])
+        index['timestamps'] = episode['timestamps'].to_array().tolist()
+        index['cameras'] = {}
+        for cam_name, camera in episode['cameras'].items():
+            stream = camera['stream']
+            for chunk in camera['frames'].chunks():
+                stream.append(chunk)
+            stream.close()
+            index['cameras'][cam_name] = {
+                'file': stream.path.name,
+                'steps': camera['steps'].to_array().tolist()
+            }
+            
+        if episode['actions'] is not None:
+            write("actions.b2nd", episode['actions'])
+            index['actions_file'] = "actions.b2nd"
+            
+        with open(path, 'w') as f:
+            json.dump(index, f, default=lambda value: np.asarray(value).tolist())
         
     async def cleanup(self) -> None:
         """Clean up resources."""
@@ -303,8 +913,10 @@ class DemonstrationCollector:
             if self.camera_manager:
                 self.camera_manager.stop_all()
                 
-            # Shutdown executor
+            # Shutdown executors
             self._executor.shutdown(wait=True)
+            self._stream_executor.shutdown(wait=True)
+            self._encode_pool.shutdown(wait=True)
             
             logger.info("Cleanup completed")
             
@@ -334,25 +946,27 @@ async def interactive_collection_loop(collector: DemonstrationCollector) -> None
         """Background control loop for recording."""
         nonlocal recording
         
+        rng = np.random.default_rng()
+        zero_velocities = np.zeros(7)
+        ticker = _DeadlineTicker(_CONTROL_PERIOD_S)
         while True:
             if recording and collector.recording:
-                # Simulate robot state (replace with actual robot state)
+                # Simulate robot state and action (replace with actual
+                # robot state and control)
+                joint_positions, action = rng.standard_normal((2, 7))
                 robot_state = {
-                    'joint_positions': np.random.randn(7).tolist(),
-                    'joint_velocities': np.zeros(7).tolist(),
+                    'joint_positions': joint_positions,
+                    'joint_velocities': zero_velocities,
                     'gripper_position': 0.0,
                     'timestamp': time.time()
                 }
                 
-                # Simulate action (replace with actual control)
-                action = np.random.randn(7).tolist()
-                
                 try:
                     await collector.record_step(robot_state, action)
                 except Exception as e:
                     logger.error(f"Error recording step: {e}")
                     
-            await asyncio.sleep(0.005)  # 200Hz
+            await ticker.wait()
     
     # Start control loop
     control_task = asyncio.create_task(control_loop())
@@ -422,17 +1036,22 @@ async def main() -> None:
             
             await collector.start_episode("automatic_demonstration")
             
-            for _ in range(6000):  # 30 seconds at 200Hz
+            # Simulated joint positions and actions for the whole run, drawn
+            # up front so steps index views instead of calling the RNG
+            num_steps = 6000  # 30 seconds at 200Hz
+            simulated = np.random.default_rng().standard_normal((num_steps, 2, 7)).astype(np.float32)
+            zero_velocities = np.zeros(7, dtype=np.float32)
+            ticker = _DeadlineTicker(_CONTROL_PERIOD_S)
+            for joint_positions, action in simulated:
                 robot_state = {
-                    'joint_positions': np.random.randn(7).tolist(),
-                    'joint_velocities': np.zeros(7).tolist(),
+                    'joint_positions': joint_positions,
+                    'joint_velocities': zero_velocities,
                     'gripper_position': 0.0,
                     'timestamp': time.time()
                 }
-                action = np.random.randn(7).tolist()
                 
                 await collector.record_step(robot_state, action)
-                await asyncio.sleep(0.005)
+                await ticker.wait()
                 
             await collector.end_episode()
             logger.info("Automatic collection completed")
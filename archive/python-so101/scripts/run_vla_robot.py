@@ -4,39 +4,82 @@ Main script to run SO-101 robot with VLA control.
 """
 
 import asyncio
-import yaml
 import os
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from robot.camera_manager import CameraManager, CameraConfig, CameraType
+from robot.camera_manager import CameraManager, load_yaml
 from robot.vla_client import VLAClient, VLAConfig
 
+# Items in flight between pipeline stages; stale items are replaced
+PIPELINE_DEPTH = 2
+
+def put_latest(queue: asyncio.Queue, item) -> None:
+    """Put item on a bounded queue, dropping the oldest entry when full."""
+    while True:
+        try:
+            queue.put_nowait(item)
+            return
+        except asyncio.QueueFull:
+            queue.get_nowait()
+
+async def camera_task(camera_manager, raw_frames_q: asyncio.Queue, rate_hz: float):
+    """Stage A: read camera frames at the inference rate."""
+    loop = asyncio.get_running_loop()
+    period = 1.0 / rate_hz
+    deadline = loop.time()
+    while True:
+        # get_frames() refills one reused FrameSet of pool slots, so queue a
+        # snapshot; slicing to BGR also drops RealSense depth for JPEG
+        frames = camera_manager.get_frames()
+        put_latest(raw_frames_q, {k: v[..., :3].copy() for k, v in frames.items()})
+        
+        deadline += period
+        delay = deadline - loop.time()
+        if delay < 0:
+            deadline = loop.time()
+            delay = 0
+        await asyncio.sleep(delay)
+
+async def preproc_task(vla_client, raw_frames_q: asyncio.Queue, obs_q: asyncio.Queue):
+    """Stage B: encode frames and state into observations."""
+    while True:
+        frames = await raw_frames_q.get()
+        obs = await vla_client.preprocess_observation(
+            frames,
+            {'joint_positions': [0]*7}
+        )
+        put_latest(obs_q, obs)
+
+async def infer_task(vla_client, obs_q: asyncio.Queue):
+    """Stage C: run inference on the latest observation."""
+    while True:
+        obs = await obs_q.get()
+        await vla_client.infer_action(obs)
+
 async def main():
     # Load configurations
-    with open('robot/configs/camera_config.yaml', 'r') as f:
-        camera_config = yaml.safe_load(f)
-    
-    with open('robot/configs/vla_config.yaml', 'r') as f:
-        vla_config = yaml.safe_load(f)
+    camera_config = load_yaml('robot/configs/camera_config.yaml')
+    vla_config = load_yaml('robot/configs/vla_config.yaml')
     
     # Initialize camera manager
-    camera_configs = []
+    camera_manager = CameraManager()
     for cam_name, cam_cfg in camera_config['cameras'].items():
-        camera_configs.append(CameraConfig(
+        # RealSense cameras are addressed by serial, USB cameras by index
+        device_id = cam_cfg.get('serial', '') if cam_cfg['type'] == 'realsense' else cam_cfg.get('device_id', 0)
+        camera_manager.add_camera(
             name=cam_name,
-            type=CameraType(cam_cfg['type']),
-            device_id=cam_cfg.get('device_id', 0),
+            camera_type=cam_cfg['type'],
+            device_id=device_id,
             width=cam_cfg['resolution'][0],
             height=cam_cfg['resolution'][1],
-            fps=cam_cfg['fps']
-        ))
-    
-    camera_manager = CameraManager(camera_configs)
-    await camera_manager.initialize()
-    print(f"Initialized {len(camera_configs)} cameras")
+            fps=cam_cfg['fps'],
+            mount_position=cam_cfg.get('position', 'wrist')
+        )
+    camera_manager.start_all()
+    print(f"Initialized {len(camera_manager.cameras)} cameras")
     
     # Initialize VLA client
     vla_client_config = VLAConfig(
@@ -54,31 +97,23 @@ async def main():
     print("\nVLA Robot Control Active")
     print("Press Ctrl+C to stop")
     
+    # Capture, preprocessing and inference overlap instead of running
+    # serially, so encoding the next frame proceeds while the server infers
+    raw_frames_q = asyncio.Queue(maxsize=PIPELINE_DEPTH)
+    obs_q = asyncio.Queue(maxsize=PIPELINE_DEPTH)
+    
     try:
-        while True:
-            # Get frames
-            frames = await camera_manager.get_frames()
-            
-            # Process and infer
-            obs = await vla_client.preprocess_observation(
-                {k: v['color'] for k, v in frames.items() if v},
-                {'joint_positions': [0]*7}
-            )
+        await asyncio.gather(
+            camera_task(camera_manager, raw_frames_q, vla_config['vla']['inference_rate']),
+            preproc_task(vla_client, raw_frames_q, obs_q),
+            infer_task(vla_client, obs_q)
+        )
             
-            action = await vla_client.infer_action(obs)
-cat >> Makefile << 'EOF'
-
-# VLA commands
-run-vla-server:
-	@echo "Starting VLA model server..."
-	cd policy_server && python vla_server.py
-
-run-vla-robot:
-	@echo "Starting VLA-controlled robot..."
-	python scripts/run_vla_robot.py
-
-install-vla-deps:
-	@echo "Installing VLA dependencies..."
-	pip install fastapi uvicorn aiohttp pydantic
+    except KeyboardInterrupt:
+        print("\nStopping VLA robot control")
+    finally:
+        camera_manager.stop_all()
+        await vla_client.cleanup()
 
-.PHONY: run-vla-server run-vla-robot install-vla-deps
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests for scripts/calibrate_cameras.py.
+
+Run from archive/python-so101 with: python -m unittest discover tests
+"""
+
+import sys
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from calibrate_cameras import _READ_RETRY_S, _GrabThread
+
+
+class _DisconnectedCapture:
+    """Capture whose reads fail immediately, counting how often it is read."""
+
+    def __init__(self) -> None:
+        self.reads = 0
+
+    def read(self):
+        self.reads += 1
+        return False, None
+
+
+class GrabThreadTest(unittest.TestCase):
+
+    def test_failed_reads_back_off(self) -> None:
+        cap = _DisconnectedCapture()
+        grabber = _GrabThread(cap)
+        seq, waits = 0, 0
+        start = time.monotonic()
+        while time.monotonic() - start < 10 * _READ_RETRY_S:
+            frame, seq = grabber.next_frame(seq)
+            self.assertIsNone(frame)
+            waits += 1
+        grabber.stop()
+
+        self.assertLessEqual(cap.reads, 12)
+        self.assertLessEqual(waits, 12)
+        self.assertGreater(grabber.consecutive_failures, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Tests for robot.camera_manager.
+
+Run from archive/python-so101 with: python -m unittest discover tests
+"""
+
+import sys
+import threading
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from robot.camera_manager import (
+    CameraConfig, CameraInterface, CameraManager, CameraType, CaptureBarrier,
+    V4L2Camera, _SharedSlotPublisher
+)
+
+
+def _stub_linuxpy(captures: list) -> dict:
+    """
+    Build stand-in linuxpy modules whose VideoCapture records its arguments.
+
+    Args:
+        captures: List each constructed VideoCapture is appended to
+
+    Returns:
+        sys.modules entries for linuxpy.video.device and its parents
+    """
+    class Device:
+        @classmethod
+        def from_id(cls, index):
+            return cls()
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    class VideoCapture:
+        # Mirrors linuxpy's signature: the buffer count is `size`
+        def __init__(self, device, size=2, source=None):
+            self.size = size
+            captures.append(self)
+
+        def set_format(self, width, height, pixel_format):
+            pass
+
+        def set_fps(self, fps):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def __iter__(self):
+            return iter(())
+
+    device_module = types.ModuleType("linuxpy.video.device")
+    device_module.Device = Device
+    device_module.VideoCapture = VideoCapture
+    device_module.PixelFormat = types.SimpleNamespace(MJPEG="MJPG")
+    return {
+        "linuxpy": types.ModuleType("linuxpy"),
+        "linuxpy.video": types.ModuleType("linuxpy.video"),
+        "linuxpy.video.device": device_module,
+    }
+
+
+class CaptureBarrierTest(unittest.TestCase):
+
+    def test_rounds_release_once_every_party_arrives(self) -> None:
+        barrier = CaptureBarrier(2, timeout=1.0)
+        results: list = []
+        waiter = threading.Thread(target=lambda: results.append(barrier.wait(0, 0)))
+        waiter.start()
+        pulse = barrier.wait(0, 0)
+        waiter.join()
+        self.assertEqual(pulse[0], 1)
+        self.assertEqual(results, [pulse])
+
+    def test_camera_that_fails_to_open_leaves_the_barrier(self) -> None:
+        manager = CameraManager()
+        for name in ("good", "broken"):
+            manager.add_camera(name, camera_type="usb", device_id=0, width=4, height=2)
+        good, broken = manager._camera_list
+        rounds: list = []
+
+        def capture_rounds() -> None:
+            barrier = good.trigger
+            for _ in range(20):
+                if len(rounds) == 3:
+                    break
+                pulse = barrier.wait(0, 0)
+                if pulse is not None:
+                    rounds.append(pulse)
+
+        def fail_to_open() -> None:
+            raise RuntimeError("no such device")
+
+        good._capture_loop = capture_rounds
+        broken._capture_loop = fail_to_open
+        with mock.patch.object(CameraManager, "_schedule_trigger_delays"):
+            manager.start_all(barrier=True)
+        good.capture_thread.join(timeout=2.0)
+        broken.capture_thread.join(timeout=2.0)
+
+        self.assertEqual(len(rounds), 3)
+        self.assertIsNone(broken.trigger)
+        self.assertEqual(manager._trigger.parties, 0)
+
+
+class FramePoolTest(unittest.TestCase):
+
+    def _camera(self, **overrides) -> CameraInterface:
+        config = CameraConfig(
+            name="cam", type=CameraType.USB, device_id=0,
+            width=4, height=2, buffer_size=2, **overrides
+        )
+        return CameraInterface(config)
+
+    def _capture(self, camera: CameraInterface, timestamp: int) -> None:
+        frame = camera._next_pool_frame()
+        frame.fill(timestamp)
+        camera.frame_buffer.put(frame, timestamp)
+
+    def test_newest_only_never_reuses_a_slot_the_ring_holds(self) -> None:
+        camera = self._camera(drop_policy="newest_only")
+        buffer = camera.frame_buffer
+        self._capture(camera, 1)
+        buffer.get_latest()
+        for timestamp in (2, 3, 4):
+            self._capture(camera, timestamp)
+
+        frame = buffer.get_synchronized(1, tolerance=1e-9)
+        self.assertIsNotNone(frame)
+        self.assertTrue(np.all(frame == 1))
+        latest, timestamp = buffer.get_latest()
+        self.assertEqual(timestamp, 4)
+        self.assertTrue(np.all(latest == 4))
+
+    def test_keep_all_pool_stays_round_robin(self) -> None:
+        camera = self._camera()
+        pool = list(camera._frame_pool)
+        used = []
+        for timestamp in range(1, 7):
+            used.append(camera._next_pool_frame())
+            camera.frame_buffer.put(used[-1], timestamp)
+        self.assertTrue(all(a is b for a, b in zip(used, pool + pool)))
+
+    def test_newest_only_rejected_for_capture_process(self) -> None:
+        with self.assertRaises(ValueError):
+            self._camera(drop_policy="newest_only", capture_process=True)
+
+
+class RetrieveCadenceTest(unittest.TestCase):
+
+    def _decoded_per_second(self, camera_fps: float, jitter_ns: int) -> int:
+        config = CameraConfig(name="cam", type=CameraType.USB, device_id=0, fps=30)
+        camera = CameraInterface(config)
+        rng = np.random.default_rng(0)
+        next_retrieve_time = 0
+        decoded = 0
+        start = 1_000_000_000
+        for k in range(int(camera_fps)):
+            now = start + int(k * 1e9 / camera_fps) + int(rng.integers(-jitter_ns, jitter_ns + 1))
+            if camera._retrieve_due(now, next_retrieve_time):
+                decoded += 1
+                next_retrieve_time = camera._next_retrieve_time(now, next_retrieve_time)
+        return decoded
+
+    def test_jittered_frames_at_config_fps_are_all_decoded(self) -> None:
+        self.assertEqual(self._decoded_per_second(30, 500_000), 30)
+
+    def test_faster_camera_is_decoded_at_config_fps(self) -> None:
+        self.assertEqual(self._decoded_per_second(60, 500_000), 30)
+
+    def test_slower_camera_decodes_every_frame(self) -> None:
+        self.assertEqual(self._decoded_per_second(25, 500_000), 25)
+
+
+class SharedSlotPublisherTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        config = CameraConfig(
+            name="cam", type=CameraType.USB, device_id=0,
+            width=4, height=2, buffer_size=2
+        )
+        self.camera = CameraInterface(config)
+        self.sent: list = []
+        self.released: list = []
+        conn = types.SimpleNamespace(send=self.sent.append)
+        free_conn = types.SimpleNamespace(
+            poll=lambda timeout: bool(self.released), recv=lambda: self.released.pop(0)
+        )
+        self.publisher = _SharedSlotPublisher(
+            self.camera._frame_pool, self.camera._take_pool_slot, conn, free_conn
+        )
+        self.camera.frame_buffer = self.publisher
+
+    def test_pool_frame_is_announced_without_copying(self) -> None:
+        frame = self.camera._next_pool_frame()
+        frame.fill(7)
+        self.publisher.put(frame, 1)
+        self.assertEqual(self.sent, [(0, 1)])
+
+    def test_decoded_frame_is_copied_into_a_new_slot(self) -> None:
+        self.publisher.put(np.full((2, 4, 3), 5, np.uint8), 1)
+        self.publisher.put(np.full((2, 4, 3), 6, np.uint8), 2)
+        self.assertEqual(self.sent, [(0, 1), (1, 2)])
+        self.assertTrue(np.all(self.camera._frame_pool[1] == 6))
+
+    def test_resized_driver_frame_fills_the_slot_it_was_given(self) -> None:
+        self.camera._next_pool_frame()
+        self.publisher.put(np.full((4, 8, 3), 9, np.uint8), 1)
+        self.assertEqual(self.sent, [(0, 1)])
+        self.assertTrue(np.all(self.camera._frame_pool[0] == 9))
+
+    def test_only_slots_the_parent_released_are_rewritten(self) -> None:
+        for timestamp in (1, 2, 3):
+            self.publisher.put(self.camera._next_pool_frame(), timestamp)
+        self.released.append(1)
+        self.publisher.put(self.camera._next_pool_frame(), 4)
+        self.assertEqual(self.sent, [(0, 1), (1, 2), (2, 3), (1, 4)])
+
+
+class ReceiveLoopTest(unittest.TestCase):
+
+    def test_slots_are_released_once_the_ring_evicts_them(self) -> None:
+        config = CameraConfig(
+            name="cam", type=CameraType.USB, device_id=0,
+            width=4, height=2, buffer_size=1, capture_process=True
+        )
+        camera = CameraInterface(config)
+        announced = [(0, 1), (1, 2), (2, 3)]
+        released: list = []
+
+        def recv():
+            if len(announced) == 1:
+                camera.is_running = False
+            return announced.pop(0)
+
+        camera._conn = types.SimpleNamespace(
+            poll=lambda timeout: True, recv=recv, close=lambda: None
+        )
+        camera._free_conn = types.SimpleNamespace(send=released.append, close=lambda: None)
+        camera.is_running = True
+        camera._receive_loop()
+
+        self.assertEqual(released, [0, 1])
+        self.assertEqual(camera.frame_buffer.get_latest()[1], 3)
+
+
+class V4L2CameraTest(unittest.TestCase):
+
+    def _run_capture(self, buffer_size: int) -> list:
+        captures: list = []
+        config = CameraConfig(
+            name="cam", type=CameraType.USB, device_id=0,
+            width=64, height=48, buffer_size=buffer_size, backend="v4l2"
+        )
+        camera = V4L2Camera(config)
+        camera.is_running = True
+        with mock.patch.dict(sys.modules, _stub_linuxpy(captures)):
+            camera._capture_loop()
+        return captures
+
+    def test_single_buffered_capture_requests_one_driver_buffer(self) -> None:
+        captures = self._run_capture(buffer_size=1)
+        self.assertEqual(len(captures), 1)
+        self.assertEqual(captures[0].size, 1)
+
+    def test_default_capture_keeps_linuxpy_buffer_count(self) -> None:
+        captures = self._run_capture(buffer_size=5)
+        self.assertEqual(captures[0].size, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,14 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, List, Optional, Dict, Any, Tuple
+import asyncio
 import time
 
-app = FastAPI(title="WALL-X HTTP Shim", version="0.1.0")
+# Requests arriving within this window of the first one share a policy call
+BATCH_WINDOW_S = 0.005
+MAX_BATCH_SIZE = 32
 
 
 class Observation(BaseModel):
@@ -29,27 +34,158 @@ class PolicyResult(BaseModel):
     metadata: Dict[str, Any]
 
 
+def predict(observations: List[Observation]) -> List[List[Dict[str, Any]]]:
+    """Run the policy on a batch of observations, returning actions per observation."""
+    now = time.time()
+    # Mock policy: move slightly down in Z, keep gripper open
+    return [
+        [
+            {
+                "action_type": "EndEffectorDelta",
+                "values": [0.0, 0.0, -0.02, 0.0, 0.0, 0.0],
+                "confidence": 0.9,
+                "timestamp": now,
+            },
+            {
+                "action_type": "Gripper",
+                "values": [0.0],
+                "confidence": 0.95,
+                "timestamp": now,
+            },
+        ]
+        for _ in observations
+    ]
+
+
+class MicroBatcher:
+    """Collects concurrent requests into batches for one policy call each."""
+
+    def __init__(
+        self,
+        policy: Callable[[List[Observation]], List[List[Dict[str, Any]]]],
+        max_batch_size: int = MAX_BATCH_SIZE,
+        window_s: float = BATCH_WINDOW_S,
+    ) -> None:
+        self.policy = policy
+        self.max_batch_size = max_batch_size
+        self.window_s = window_s
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # Batch handed to the policy, failed by stop() if still in flight
+        self._batch: List[Tuple[Observation, asyncio.Future]] = []
+
+    def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # Fail anything in flight or still waiting so no request hangs on shutdown
+        pending = self._batch
+        self._batch = []
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        self._fail(pending, RuntimeError("Policy server shutting down"))
+
+    @staticmethod
+    def _fail(batch: List[Tuple[Observation, asyncio.Future]], error: Exception) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def submit(self, obs: Observation) -> Tuple[List[Dict[str, Any]], float, int]:
+        """Queue an observation; returns its actions, the batch time in ms and the batch size."""
+        if self._queue is None:
+            raise RuntimeError("MicroBatcher is not running")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((obs, future))
+        return await future
+
+    async def _next_batch(self) -> List[Tuple[Observation, asyncio.Future]]:
+        """Wait for one request, then gather more until the window closes or the batch is full."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.window_s
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            # Callers that disconnected while queued have cancelled futures
+            batch = [(obs, future) for obs, future in batch if not future.cancelled()]
+            if not batch:
+                continue
+
+            self._batch = batch
+            t0 = time.perf_counter()
+            try:
+                # The policy blocks (GPU/CPU bound), so keep it off the event loop
+                results = await asyncio.to_thread(self.policy, [obs for obs, _ in batch])
+            except Exception as e:
+                self._batch = []
+                self._fail(batch, e)
+                continue
+            # Left set on cancellation so stop() can fail the batch
+            self._batch = []
+            dt = (time.perf_counter() - t0) * 1000.0
+
+            if len(results) != len(batch):
+                self._fail(batch, RuntimeError(
+                    f"Policy returned {len(results)} results for {len(batch)} observations"
+                ))
+                continue
+
+            for (_, future), actions in zip(batch, results):
+                if not future.done():
+                    future.set_result((actions, dt, len(batch)))
+
+
+batcher = MicroBatcher(predict)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    batcher.start()
+    yield
+    await batcher.stop()
+
+
+app = FastAPI(
+    title="WALL-X HTTP Shim",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+
 @app.get("/")
 def root() -> Dict[str, str]:
     return {"status": "ok", "service": "wallx-shim"}
 
 
+# PolicyResult stays the documented response schema, but /infer returns an
+# ORJSONResponse built from plain dicts so FastAPI skips revalidating and
+# re-encoding the model on every request
 @app.post("/infer", response_model=PolicyResult)
-def infer(obs: Observation) -> PolicyResult:
-    t0 = time.time()
-    # Mock policy: move slightly down in Z, keep gripper open
-    ee_delta = Action(
-        action_type="EndEffectorDelta",
-        values=[0.0, 0.0, -0.02, 0.0, 0.0, 0.0],
-        confidence=0.9,
-        timestamp=time.time(),
-    )
-    gripper = Action(
-        action_type="Gripper",
-        values=[0.0],
-        confidence=0.95,
-        timestamp=time.time(),
+async def infer(obs: Observation) -> ORJSONResponse:
+    actions, dt, batch_size = await batcher.submit(obs)
+    return ORJSONResponse(
+        {"actions": actions, "inference_time_ms": dt, "metadata": {"batch_size": batch_size}}
     )
-    dt = (time.time() - t0) * 1000.0
-    return PolicyResult(actions=[ee_delta, gripper], inference_time_ms=dt, metadata={})
-